@@ -1,10 +1,17 @@
+import asyncio
 import discord
+import functools
 import json
+import logging
 import os
 from core.models import GuildSettings, DiscordRole, DiscordChannel, Automation, Action
+from django.db import transaction
 from .templates import get_template_async
 from asgiref.sync import sync_to_async
 
+# Child of the 'bot' logger, which bot/main.py routes through a queue listener
+logger = logging.getLogger(__name__)
+
 
 # Load default automation definitions from fixture (data, not code)
 _FIXTURE_PATH = os.path.join(
@@ -12,11 +19,55 @@ _FIXTURE_PATH = os.path.join(
     'core', 'fixtures', 'default_automations.json',
 )
 
+
+@functools.lru_cache(maxsize=None)
 def _load_automation_fixture():
+    """Parse the fixture once per process; callers must treat it as read-only."""
     with open(_FIXTURE_PATH, 'r') as f:
         return json.load(f)
 
 
+# Channel overwrites used by setup; shared instances, never mutate them
+_DENY_READ = discord.PermissionOverwrite(read_messages=False)
+_ALLOW_READ_SEND = discord.PermissionOverwrite(read_messages=True, send_messages=True)
+_ALLOW_READ_SEND_EMBED = discord.PermissionOverwrite(read_messages=True, send_messages=True, embed_links=True)
+
+
+# Concurrent set_permissions calls in restrict_pending_role
+_RESTRICT_CONCURRENCY = 10
+
+
+# GuildSettings resource columns; ensure_required_resources saves only the ones
+# it repaired (its instance may come from the bot's settings cache)
+_RESOURCE_FIELDS = [
+    'bot_admin_role_id', 'pending_role_id',
+    'bounce_channel_id', 'pending_channel_id', 'updated_at',
+]
+# setup_guild also refreshes the guild name from Discord
+_SETUP_FIELDS = ['guild_name'] + _RESOURCE_FIELDS
+
+
+def _persist_resources(guild_settings, roles, channels, fields=_RESOURCE_FIELDS):
+    """Upsert the cached roles/channels and save the settings in one transaction."""
+    with transaction.atomic():
+        for model, items in ((DiscordRole, roles), (DiscordChannel, channels)):
+            if not items:
+                continue
+            # Only write rows that are new or renamed (setup usually finds them unchanged)
+            cached = dict(model.objects.filter(
+                guild=guild_settings, discord_id__in=[item.id for item in items],
+            ).values_list('discord_id', 'name'))
+            changed = [item for item in items if cached.get(item.id) != item.name]
+            if changed:
+                model.objects.bulk_create(
+                    [model(discord_id=item.id, guild=guild_settings, name=item.name) for item in changed],
+                    update_conflicts=True,
+                    unique_fields=['guild', 'discord_id'],
+                    update_fields=['name'],
+                )
+        guild_settings.save(update_fields=fields)
+
+
 async def setup_guild(bot, guild):
     """
     Setup guild when bot joins:
@@ -28,92 +79,52 @@ async def setup_guild(bot, guild):
     6. Save to database
     """
 
-    # Get or create guild settings
-    guild_settings, created = await sync_to_async(GuildSettings.objects.get_or_create)(
-        guild_id=guild.id,
-        defaults={'guild_name': guild.name}
+    # Get or create guild settings (DB) while the BotAdmin + Pending roles
+    # are fetched/created (Discord) in one wave
+    (guild_settings, created), bot_admin_role, pending_role = await asyncio.gather(
+        GuildSettings.objects.aget_or_create(guild_id=guild.id, defaults={'guild_name': guild.name}),
+        get_or_create_role(guild, "BotAdmin", color=discord.Color.blue()),
+        get_or_create_role(guild, "Pending", color=discord.Color.orange()),
     )
 
     if not created:
-        guild_settings.guild_name = guild.name
-        await sync_to_async(guild_settings.save)()
+        guild_settings.guild_name = guild.name  # saved with the resources below
 
-    # Create BotAdmin role
-    bot_admin_role = await get_or_create_role(guild, "BotAdmin", color=discord.Color.blue())
     guild_settings.bot_admin_role_id = bot_admin_role.id
-
-    await sync_to_async(DiscordRole.objects.update_or_create)(
-        discord_id=bot_admin_role.id,
-        guild=guild_settings,
-        defaults={'name': bot_admin_role.name}
-    )
-
-    # Create Pending role
-    pending_role = await get_or_create_role(guild, "Pending", color=discord.Color.orange())
     guild_settings.pending_role_id = pending_role.id
 
-    await sync_to_async(DiscordRole.objects.update_or_create)(
-        discord_id=pending_role.id,
-        guild=guild_settings,
-        defaults={'name': pending_role.name}
+    # Assign BotAdmin role to bot itself, create #bounce (single channel for all
+    # bot output) and #pending (visible ONLY to Pending role + bot) in one wave
+    assignment_failed, bounce_channel, pending_channel = await asyncio.gather(
+        _assign_bot_admin_role(guild, bot_admin_role),
+        get_or_create_channel(guild, "bounce", bot_admin_role),
+        get_or_create_pending_channel(guild, pending_role),
     )
-
-    # Assign BotAdmin role to bot itself
-    assignment_failed = False
-    try:
-        await guild.me.add_roles(bot_admin_role)
-        print(f"✅ Assigned BotAdmin role to bot in {guild.name}")
-    except Exception as e:
-        assignment_failed = True
-        print(f"❌ Failed to assign BotAdmin role to bot in {guild.name}: {e}")
-        print(f"   Bot permissions: {guild.me.guild_permissions}")
-
-    # Create #bounce channel (single channel for all bot output)
-    bounce_channel = await get_or_create_channel(guild, "bounce", bot_admin_role)
     guild_settings.bounce_channel_id = bounce_channel.id
-
-    await sync_to_async(DiscordChannel.objects.update_or_create)(
-        discord_id=bounce_channel.id,
-        guild=guild_settings,
-        defaults={'name': bounce_channel.name}
-    )
-
-    # Create #pending channel (visible ONLY to Pending role + bot)
-    pending_channel = await get_or_create_pending_channel(guild, pending_role)
     guild_settings.pending_channel_id = pending_channel.id
 
-    await sync_to_async(DiscordChannel.objects.update_or_create)(
-        discord_id=pending_channel.id,
-        guild=guild_settings,
-        defaults={'name': pending_channel.name}
+    # Restrict Pending role from seeing all other channels (Discord) while
+    # resources are saved + default automations created (DB: one transaction)
+    _, count = await asyncio.gather(
+        restrict_pending_role(guild, pending_role),
+        sync_to_async(_persist_setup)(
+            guild_settings, [bot_admin_role, pending_role], [bounce_channel, pending_channel],
+        ),
     )
-
-    # Restrict Pending role from seeing all other channels
-    await restrict_pending_role(guild, pending_role)
-
-    await sync_to_async(guild_settings.save)()
-
-    # Create default automations
-    await _create_default_automations(guild_settings)
+    logger.info("✅ %s automations configured for %s", count, guild_settings.guild_name)
 
     if assignment_failed:
+        # Built once; #general is the fallback if #bounce can't take it
         try:
-            bot_role = guild.me.top_role
-            bot_role_name = bot_role.name if bot_role.name != "@everyone" else "(no assigned role)"
-            diagnostic_msg = await get_template_async(guild_settings, 'SETUP_DIAGNOSTIC')
-            diagnostic_msg = diagnostic_msg.format(bot_role=bot_role_name)
-            await bounce_channel.send(diagnostic_msg)
-        except Exception:
+            diagnostic_msg = await _build_setup_diagnostic(guild, guild_settings)
             try:
-                general = discord.utils.get(guild.text_channels, name='general')
+                await bounce_channel.send(diagnostic_msg)
+            except Exception:
+                general = _text_channel_named(guild, 'general')
                 if general:
-                    bot_role = guild.me.top_role
-                    bot_role_name = bot_role.name if bot_role.name != "@everyone" else "(no assigned role)"
-                    diagnostic_msg = await get_template_async(guild_settings, 'SETUP_DIAGNOSTIC')
-                    diagnostic_msg = diagnostic_msg.format(bot_role=bot_role_name)
                     await general.send(diagnostic_msg)
-            except Exception:
-                print("Could not send diagnostic message to any channel")
+        except Exception:
+            logger.warning("Could not send diagnostic message to any channel")
 
     # Send welcome message to bounce channel
     try:
@@ -127,57 +138,102 @@ async def setup_guild(bot, guild):
             )
             await bounce_channel.send(message)
     except Exception as e:
-        print(f"Failed to send welcome message: {e}")
+        logger.warning("Failed to send welcome message: %s", e)
+
+
+async def _build_setup_diagnostic(guild, guild_settings):
+    """SETUP_DIAGNOSTIC text naming the bot's top role."""
+    bot_role = guild.me.top_role
+    bot_role_name = bot_role.name if bot_role.name != "@everyone" else "(no assigned role)"
+    template = await get_template_async(guild_settings, 'SETUP_DIAGNOSTIC')
+    return template.format(bot_role=bot_role_name)
+
+
+async def _assign_bot_admin_role(guild, bot_admin_role):
+    """Give the bot its BotAdmin role; returns True if that failed."""
+    try:
+        await guild.me.add_roles(bot_admin_role)
+        logger.info("✅ Assigned BotAdmin role to bot in %s", guild.name)
+        return False
+    except Exception as e:
+        logger.error("❌ Failed to assign BotAdmin role to bot in %s: %s", guild.name, e)
+        logger.error("   Bot permissions: %s", guild.me.guild_permissions)
+        return True
+
 
+def _persist_setup(guild_settings, roles, channels):
+    """All of setup_guild's writes in one transaction; returns the automation count."""
+    with transaction.atomic():
+        _persist_resources(guild_settings, roles, channels, fields=_SETUP_FIELDS)
+        return _create_default_automations_db(guild_settings)
+
+
+def _create_default_automations_db(gs):
+    """Insert missing default automations in one transaction; returns the guild's count.
 
-async def _create_default_automations(gs):
-    """Create default event-driven automations for this guild.
-    
     Definitions loaded from core/fixtures/default_automations.json —
     the same data an admin could create manually via the admin panel.
     """
     defaults = _load_automation_fixture()
 
-    for d in defaults:
-        auto, created = await sync_to_async(Automation.objects.get_or_create)(
-            guild=gs,
-            name=d['name'],
-            defaults={
-                'trigger': d['trigger'],
-                'trigger_config': d.get('trigger_config', {}),
-                'description': d.get('description', ''),
-                'enabled': True,
-            }
-        )
-        if created:
-            for a in d.get('actions', []):
-                await sync_to_async(Action.objects.create)(
-                    automation=auto,
-                    order=a['order'],
-                    action_type=a['action_type'],
-                    config=a.get('config', {}),
+    with transaction.atomic():
+        # Lock the guild row so concurrent setups (re-invite) see each other's inserts
+        GuildSettings.objects.select_for_update().only('pk').get(pk=gs.pk)
+        existing = set(Automation.objects.filter(guild=gs).values_list('name', flat=True))
+        missing = [d for d in defaults if d['name'] not in existing]
+        if missing:
+            automations = Automation.objects.bulk_create([
+                Automation(
+                    guild=gs,
+                    name=d['name'],
+                    trigger=d['trigger'],
+                    trigger_config=d.get('trigger_config', {}),
+                    description=d.get('description', ''),
                     enabled=True,
                 )
-
-    count = await sync_to_async(Automation.objects.filter(guild=gs).count)()
-    print(f"✅ {count} automations configured for {gs.guild_name}")
+                for d in missing
+            ])
+            actions = []
+            for auto, d in zip(automations, missing):
+                for a in d.get('actions', []):
+                    # Copy: the fixture is cached and normalize_config works in place
+                    action = Action(
+                        automation=auto,
+                        order=a['order'],
+                        action_type=a['action_type'],
+                        config=dict(a.get('config', {})),
+                        enabled=True,
+                    )
+                    action.normalize_config()  # bulk_create skips Action.save
+                    actions.append(action)
+            Action.objects.bulk_create(actions)
+        return len(existing) + len(missing)
+
+
+def _text_channel_named(guild, name):
+    """First text channel with this name (guild.text_channels re-sorts on every access)."""
+    return next(
+        (c for c in guild.channels if isinstance(c, discord.TextChannel) and c.name == name),
+        None,
+    )
 
 
 async def get_or_create_pending_channel(guild, pending_role):
     """Create #pending channel visible ONLY to Pending role and bot"""
-    channel = discord.utils.get(guild.text_channels, name='pending')
+    channel = _text_channel_named(guild, 'pending')
 
     overwrites = {
-        guild.default_role: discord.PermissionOverwrite(read_messages=False),
-        pending_role: discord.PermissionOverwrite(read_messages=True, send_messages=True),
-        guild.me: discord.PermissionOverwrite(read_messages=True, send_messages=True)
+        guild.default_role: _DENY_READ,
+        pending_role: _ALLOW_READ_SEND,
+        guild.me: _ALLOW_READ_SEND,
     }
 
     if channel:
-        try:
-            await channel.edit(overwrites=overwrites)
-        except Exception:
-            pass
+        if channel.overwrites != overwrites:
+            try:
+                await channel.edit(overwrites=overwrites)
+            except Exception:
+                pass
         return channel
 
     try:
@@ -188,15 +244,23 @@ async def get_or_create_pending_channel(guild, pending_role):
     return channel
 
 
+async def _bounded(sem, coro):
+    async with sem:
+        return await coro
+
+
 async def restrict_pending_role(guild, pending_role):
     """Prevent Pending role from seeing all channels except #pending"""
-    for channel in guild.text_channels:
-        if channel.name == 'pending':
-            continue
-        try:
-            await channel.set_permissions(pending_role, read_messages=False)
-        except Exception:
-            pass
+    # Each channel's permissions route has its own rate-limit bucket, so nothing
+    # paces these for us: cap how many are in flight (failures are ignored),
+    # skipping channels that already deny the role
+    sem = asyncio.Semaphore(_RESTRICT_CONCURRENCY)
+    await asyncio.gather(*(
+        _bounded(sem, channel.set_permissions(pending_role, read_messages=False))
+        for channel in guild.channels
+        if isinstance(channel, discord.TextChannel) and channel.name != 'pending'
+        and channel.overwrites_for(pending_role).read_messages is not False
+    ), return_exceptions=True)
 
 
 async def get_or_create_role(guild, name, **kwargs):
@@ -210,26 +274,23 @@ async def get_or_create_role(guild, name, **kwargs):
 
 async def get_or_create_channel(guild, name, admin_role):
     """Get existing channel or create new one with proper permissions"""
-    channel = discord.utils.get(guild.text_channels, name=name)
-
-    if channel:
-        try:
-            overwrites = {
-                guild.default_role: discord.PermissionOverwrite(read_messages=False),
-                admin_role: discord.PermissionOverwrite(read_messages=True, send_messages=True),
-                guild.me: discord.PermissionOverwrite(read_messages=True, send_messages=True, embed_links=True)
-            }
-            await channel.edit(overwrites=overwrites)
-        except Exception:
-            pass
-        return channel
+    channel = _text_channel_named(guild, name)
 
     overwrites = {
-        guild.default_role: discord.PermissionOverwrite(read_messages=False),
-        admin_role: discord.PermissionOverwrite(read_messages=True, send_messages=True),
-        guild.me: discord.PermissionOverwrite(read_messages=True, send_messages=True, embed_links=True)
+        guild.default_role: _DENY_READ,
+        admin_role: _ALLOW_READ_SEND,
+        guild.me: _ALLOW_READ_SEND_EMBED,
     }
 
+    if channel:
+        # Only hit the API when the overwrites actually drifted
+        if channel.overwrites != overwrites:
+            try:
+                await channel.edit(overwrites=overwrites)
+            except Exception:
+                pass
+        return channel
+
     try:
         channel = await guild.create_text_channel(name, overwrites=overwrites)
     except Exception:
@@ -238,72 +299,62 @@ async def get_or_create_channel(guild, name, admin_role):
     return channel
 
 
+def _resolve(getter, discord_id):
+    return getter(discord_id) if discord_id else None
+
+
 async def ensure_required_resources(bot, guild_settings):
     """
     Ensure required roles/channels exist.
     Called when needed (e.g., before role assignment).
+    Returns the (possibly updated) guild settings.
     """
     guild = bot.get_guild(guild_settings.guild_id)
     if not guild:
-        return
+        return guild_settings
+
+    # Resolve everything from the gateway cache first (plain dict lookups)
+    bot_admin_role = _resolve(guild.get_role, guild_settings.bot_admin_role_id)
+    pending_role = _resolve(guild.get_role, guild_settings.pending_role_id)
+    bounce_channel = _resolve(guild.get_channel, guild_settings.bounce_channel_id)
+    pending_channel = _resolve(guild.get_channel, guild_settings.pending_channel_id)
 
-    changed = False
+    # Steady state: nothing to recreate
+    if bot_admin_role and pending_role and bounce_channel and pending_channel:
+        return guild_settings
+
+    created_roles = []
+    created_channels = []
+    repaired = []
 
-    # Check BotAdmin role
-    bot_admin_role = None
-    if guild_settings.bot_admin_role_id:
-        bot_admin_role = guild.get_role(guild_settings.bot_admin_role_id)
     if not bot_admin_role:
         bot_admin_role = await get_or_create_role(guild, "BotAdmin", color=discord.Color.blue())
         guild_settings.bot_admin_role_id = bot_admin_role.id
-        changed = True
-        await sync_to_async(DiscordRole.objects.update_or_create)(
-            discord_id=bot_admin_role.id,
-            guild=guild_settings,
-            defaults={'name': bot_admin_role.name}
-        )
+        created_roles.append(bot_admin_role)
+        repaired.append('bot_admin_role_id')
 
-    # Check Pending role
-    pending_role = None
-    if guild_settings.pending_role_id:
-        pending_role = guild.get_role(guild_settings.pending_role_id)
     if not pending_role:
         pending_role = await get_or_create_role(guild, "Pending", color=discord.Color.orange())
         guild_settings.pending_role_id = pending_role.id
-        changed = True
-        await sync_to_async(DiscordRole.objects.update_or_create)(
-            discord_id=pending_role.id,
-            guild=guild_settings,
-            defaults={'name': pending_role.name}
-        )
+        created_roles.append(pending_role)
+        repaired.append('pending_role_id')
 
-    # Check bounce channel
-    bounce_channel = None
-    if guild_settings.bounce_channel_id:
-        bounce_channel = guild.get_channel(guild_settings.bounce_channel_id)
     if not bounce_channel:
         bounce_channel = await get_or_create_channel(guild, "bounce", bot_admin_role)
         guild_settings.bounce_channel_id = bounce_channel.id
-        changed = True
-        await sync_to_async(DiscordChannel.objects.update_or_create)(
-            discord_id=bounce_channel.id,
-            guild=guild_settings,
-            defaults={'name': bounce_channel.name}
-        )
+        created_channels.append(bounce_channel)
+        repaired.append('bounce_channel_id')
 
-    # Check pending channel
-    pending_channel = None
-    if guild_settings.pending_channel_id:
-        pending_channel = guild.get_channel(guild_settings.pending_channel_id)
     if not pending_channel:
         pending_channel = await get_or_create_pending_channel(guild, pending_role)
         guild_settings.pending_channel_id = pending_channel.id
-        changed = True
-        await sync_to_async(DiscordChannel.objects.update_or_create)(
-            discord_id=pending_channel.id,
-            guild=guild_settings,
-            defaults={'name': pending_channel.name}
+        created_channels.append(pending_channel)
+        repaired.append('pending_channel_id')
+
+    if repaired:
+        # Only the repaired IDs: the others may be stale cached values
+        await sync_to_async(_persist_resources)(
+            guild_settings, created_roles, created_channels, fields=repaired + ['updated_at'],
         )
 
-    if changed:
-        await sync_to_async(guild_settings.save)()
+    return guild_settings
@@ -1,5 +1,8 @@
+import time
+
 from core.models import MessageTemplate, GuildMessageTemplate
 from asgiref.sync import sync_to_async
+from django.db.models.signals import post_delete, post_save
 
 
 # Default templates
@@ -64,6 +67,8 @@ You may reapply in the future if server rules allow.""",
 
     'APPROVE_DM': """✅ Your application in **{server}** has been approved! Roles assigned: {roles}""",
 
+    'APPROVE_NOTICE': """✅ {user} approved by {admin} → {roles}""",
+
     'REJECT_CONFIRM': """❌ Rejected **{user}**. Reason: {reason}""",
 
     'REJECT_DM': """❌ Your application in **{server}** has been rejected.
@@ -171,8 +176,47 @@ I need this to manage BotAdmin role assignments and channel permissions.""",
 }
 
 
+# Resolved template text per (guild_id, template_type) -> (fetched_at, content).
+# Template edits made in this process clear it via signals; edits from the
+# admin panel (a separate process) are picked up once the entry expires.
+_TEMPLATE_CACHE_TTL = 60
+_template_cache = {}
+
+
+def clear_template_cache(**kwargs):
+    """Drop all cached templates (also used as a post_save/post_delete receiver)."""
+    _template_cache.clear()
+
+
+for _model in (MessageTemplate, GuildMessageTemplate):
+    post_save.connect(clear_template_cache, sender=_model, dispatch_uid=f'template_cache_{_model.__name__}_save')
+    post_delete.connect(clear_template_cache, sender=_model, dispatch_uid=f'template_cache_{_model.__name__}_delete')
+
+
+def _template_key(guild_settings, template_type):
+    return (guild_settings.guild_id if guild_settings else None, template_type)
+
+
+def _cached_template(key):
+    """Cached content for key, or None if missing or expired."""
+    cached = _template_cache.get(key)
+    if cached and time.monotonic() - cached[0] < _TEMPLATE_CACHE_TTL:
+        return cached[1]
+    return None
+
+
 def get_template(guild_settings, template_type):
-    """Get template for guild (custom or default)"""
+    """Get template for guild (custom or default), cached for a short TTL"""
+    key = _template_key(guild_settings, template_type)
+    content = _cached_template(key)
+    if content is None:
+        content = _load_template(guild_settings, template_type)
+        _template_cache[key] = (time.monotonic(), content)
+    return content
+
+
+def _load_template(guild_settings, template_type):
+    """Resolve a template from the database (custom or default)"""
     
     # Try to get custom template
     try:
@@ -196,7 +240,10 @@ def get_template(guild_settings, template_type):
 
 
 async def get_template_async(guild_settings, template_type):
-    """Async wrapper for get_template"""
+    """Async wrapper for get_template; cache hits skip the thread hop"""
+    content = _cached_template(_template_key(guild_settings, template_type))
+    if content is not None:
+        return content
     return await sync_to_async(get_template)(guild_settings, template_type)
 
 
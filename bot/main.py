@@ -8,8 +8,17 @@ Zero business logic here. All decisions made by core.services.
 """
 
 import os
+import re
+import copy
 import sys
+import time
+import queue
+import atexit
 import asyncio
+import difflib
+import logging
+import logging.handlers
+from contextlib import nullcontext
 import discord
 from discord.ext import commands
 from dotenv import load_dotenv
@@ -21,16 +30,31 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'project.settings')
 django.setup()
 
+# These need the app registry loaded by django.setup() above
+from django.core.management import call_command  # noqa: E402
+from django.db import close_old_connections  # noqa: E402
+from django.db.models.signals import post_delete, post_save  # noqa: E402
+from core.models import GuildSettings, Application  # noqa: E402
+from core.services import handle_member_join, handle_member_remove, handle_reaction, handle_command  # noqa: E402
+from bot.handlers.guild_setup import setup_guild, ensure_required_resources  # noqa: E402
+from bot.handlers.templates import get_template_async  # noqa: E402
+
+# Logging: records are queued on the event loop and written to stdout by a
+# listener thread, so a slow pipe never stalls the gateway
+logger = logging.getLogger('bot')
+logger.setLevel(logging.INFO)
+logger.propagate = False
+_log_queue = queue.SimpleQueue()
+logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+_log_listener = logging.handlers.QueueListener(_log_queue, logging.StreamHandler(sys.stdout))
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
 # Run pending migrations on startup (bot service has no Procfile)
-from django.core.management import call_command
 try:
     call_command('migrate', '--noinput', verbosity=1)
 except Exception as e:
-    print(f'⚠️ Migration failed: {e}')
-
-from django.db import close_old_connections
-from core.services import handle_member_join, handle_member_remove, handle_reaction, handle_command
-from bot.handlers.guild_setup import setup_guild, ensure_required_resources
+    logger.warning('⚠️ Migration failed: %s', e)
 
 load_dotenv()
 
@@ -47,11 +71,56 @@ bot.remove_command('help')
 # Invite cache (purely Discord gateway state — stays in bot)
 invite_cache = {}
 
+# Reaction buttons added to tracked application embeds (approve, reject)
+_REVIEW_EMOJIS = ('\u2705', '\u274c')
+
+# Application ID in a tracked embed title ("📋 Application #12 — name")
+_APP_TITLE_RE = re.compile(r'Application #(\d+)')
+
+# Cap on Discord API writes in flight across all events, so a burst of
+# lanes queues here instead of piling onto discord.py's rate limiter
+_MAX_CONCURRENT_ACTIONS = 8
+_action_slots = asyncio.Semaphore(_MAX_CONCURRENT_ACTIONS)
+
+# Long-running actions that take a slot per REST call themselves (or, for
+# ensure_resources, hand off to guild_setup) instead of for their whole run
+_SELF_SLOTTED_ACTIONS = frozenset({'cleanup_channel', 'ensure_resources'})
+
+
+def _call_with_fresh_connection(func, *args, **kwargs):
+    close_old_connections()
+    return func(*args, **kwargs)
+
 
 async def db_call(func, *args, **kwargs):
     """Call a sync Django function safely: close stale connections, run via sync_to_async."""
-    await sync_to_async(close_old_connections)()
-    return await sync_to_async(func)(*args, **kwargs)
+    # One executor hop for both steps (same thread: sync_to_async is thread-sensitive)
+    return await sync_to_async(_call_with_fresh_connection)(func, *args, **kwargs)
+
+
+# GuildSettings reused across events for a short TTL (edits made in this
+# process drop the entry immediately via signals; panel edits within the TTL)
+_GUILD_SETTINGS_TTL = 60
+_guild_settings_cache = {}
+
+
+def _drop_cached_guild_settings(sender, instance, **kwargs):
+    _guild_settings_cache.pop(instance.guild_id, None)
+
+
+post_save.connect(_drop_cached_guild_settings, sender=GuildSettings, dispatch_uid='bot_guild_settings_save')
+post_delete.connect(_drop_cached_guild_settings, sender=GuildSettings, dispatch_uid='bot_guild_settings_delete')
+
+
+async def get_guild_settings(guild_id):
+    """GuildSettings for a guild (raises DoesNotExist), cached for a short TTL."""
+    now = time.monotonic()
+    cached = _guild_settings_cache.get(guild_id)
+    if cached and now - cached[0] < _GUILD_SETTINGS_TTL:
+        return cached[1]
+    gs = await db_call(GuildSettings.objects.get, guild_id=guild_id)
+    _guild_settings_cache[guild_id] = (now, gs)
+    return gs
 
 
 # ── Action executor ──────────────────────────────────────────────────────────
@@ -76,8 +145,7 @@ async def _get_guild_language(actions, context):
     if not guild_id:
         return None
     try:
-        from core.models import GuildSettings
-        gs = await db_call(GuildSettings.objects.get, guild_id=guild_id)
+        gs = await get_guild_settings(guild_id)
         return gs.language
     except Exception:
         return None
@@ -91,164 +159,244 @@ async def execute_actions(actions, context=None):
         from bot.handlers.translate import translate_actions
         actions = await translate_actions(actions, lang)
 
+    # Actions on the same target keep their order; different targets run
+    # concurrently.  ensure_resources is a barrier (later actions may need it).
+    lanes = {}
     for action in actions:
+        if action['type'] == 'ensure_resources':
+            await _run_lanes(lanes, context)
+            lanes = {}
+            await _run_lane([action], context)
+        else:
+            lanes.setdefault(_lane_key(action, context), []).append(action)
+    await _run_lanes(lanes, context)
+
+
+def _lane_key(action, context):
+    """Group actions that must run in order: same member, DM recipient or channel."""
+    t = action['type']
+    if t in ('add_role', 'remove_role'):
+        return ('member', action.get('guild_id'), action.get('user_id'))
+    if t == 'send_dm':
+        return ('dm', action.get('user_id'))
+    if t == 'reply':
+        channel = context.get('channel') if context else None
+        return ('channel', getattr(channel, 'id', None))
+    return ('channel', action.get('channel_id'))
+
+
+async def _run_lanes(lanes, context):
+    if lanes:
+        await asyncio.gather(*(_run_lane(lane, context) for lane in lanes.values()))
+
+
+async def _run_lane(lane, context):
+    for action in lane:
         try:
-            await _execute_one(action, context)
+            slot = nullcontext() if action['type'] in _SELF_SLOTTED_ACTIONS else _action_slots
+            async with slot:
+                await _execute_one(action, context)
         except Exception as e:
-            print(f'⚠️ Action failed ({action.get("type")}): {e}')
+            logger.warning('⚠️ Action failed (%s): %s', action.get('type'), e)
 
 
-async def _execute_one(action, context=None):
-    """Execute a single action dict."""
-    t = action['type']
+async def _exec_send_message(action, context):
+    channel = bot.get_channel(action['channel_id'])
+    if channel:
+        await channel.send(action['content'])
 
-    if t == 'send_message':
-        channel = bot.get_channel(action['channel_id'])
-        if channel:
-            await channel.send(action['content'])
 
-    elif t == 'send_embed':
-        channel = bot.get_channel(action['channel_id'])
-        if channel:
-            embed = _dict_to_embed(action['embed'])
-            await channel.send(embed=embed)
+async def _exec_send_embed(action, context):
+    channel = bot.get_channel(action['channel_id'])
+    if channel:
+        embed = _dict_to_embed(action['embed'])
+        await channel.send(embed=embed)
 
-    elif t == 'send_dm':
-        user = bot.get_user(action['user_id'])
-        if not user:
-            try:
-                user = await bot.fetch_user(action['user_id'])
-            except:
-                return
+
+async def _exec_send_dm(action, context):
+    user = bot.get_user(action['user_id'])
+    if not user:
         try:
-            await user.send(action['content'])
-        except discord.Forbidden:
-            pass
+            user = await bot.fetch_user(action['user_id'])
+        except:
+            return
+    try:
+        await user.send(action['content'])
+    except discord.Forbidden:
+        pass
+
 
-    elif t == 'reply':
-        # Reply in the same channel as the triggering message
-        if context and 'channel' in context:
-            await context['channel'].send(action['content'])
+async def _exec_reply(action, context):
+    # Reply in the same channel as the triggering message
+    if context and 'channel' in context:
+        await context['channel'].send(action['content'])
 
-    elif t == 'add_role':
-        guild = bot.get_guild(action['guild_id'])
-        if guild:
-            member = guild.get_member(action['user_id'])
+
+async def _exec_add_role(action, context):
+    guild = bot.get_guild(action['guild_id'])
+    if guild:
+        member = guild.get_member(action['user_id'])
+        # Skip the REST call (and the guild role lookup) if the member already has it
+        if member and member.get_role(action['role_id']) is None:
             role = guild.get_role(action['role_id'])
-            if member and role:
+            if role:
                 try:
                     await member.add_roles(role, reason=action.get('reason', ''))
                 except discord.Forbidden:
-                    print(f'⚠️ No permission to assign role {role.name}')
+                    logger.warning('⚠️ No permission to assign role %s', role.name)
 
-    elif t == 'remove_role':
-        guild = bot.get_guild(action['guild_id'])
-        if guild:
-            member = guild.get_member(action['user_id'])
-            role = guild.get_role(action['role_id'])
-            if member and role and role in member.roles:
-                try:
-                    await member.remove_roles(role)
-                except discord.Forbidden:
-                    pass
 
-    elif t == 'edit_message':
-        channel = bot.get_channel(action['channel_id'])
-        if channel:
+async def _exec_remove_role(action, context):
+    guild = bot.get_guild(action['guild_id'])
+    if guild:
+        member = guild.get_member(action['user_id'])
+        # Member.get_role is a lookup on the member's role ids; None means nothing to remove
+        role = member.get_role(action['role_id']) if member else None
+        if role:
             try:
-                msg = await channel.fetch_message(action['message_id'])
-                embed = _dict_to_embed(action['embed'])
-                await msg.edit(embed=embed)
-            except:
+                await member.remove_roles(role)
+            except discord.Forbidden:
                 pass
 
-    elif t == 'clear_reactions':
-        channel = bot.get_channel(action['channel_id'])
-        if channel:
-            try:
-                msg = await channel.fetch_message(action['message_id'])
-                await msg.clear_reactions()
-            except:
-                pass
 
-    elif t == 'set_permissions':
-        channel = bot.get_channel(action['channel_id'])
-        if channel:
-            guild = channel.guild
-            member = guild.get_member(action['user_id'])
-            if member:
-                perms = {}
-                for perm in action.get('allow', []):
-                    perms[perm] = True
-                try:
-                    await channel.set_permissions(member, **perms)
-                except discord.Forbidden:
-                    pass
+async def _exec_edit_message(action, context):
+    channel = bot.get_channel(action['channel_id'])
+    if channel:
+        try:
+            # A partial message edits by id without fetching it first
+            msg = channel.get_partial_message(action['message_id'])
+            embed = _dict_to_embed(action['embed'])
+            await msg.edit(embed=embed)
+        except:
+            pass
+
+
+async def _exec_clear_reactions(action, context):
+    channel = bot.get_channel(action['channel_id'])
+    if channel:
+        try:
+            msg = channel.get_partial_message(action['message_id'])
+            await msg.clear_reactions()
+        except:
+            pass
+
 
-    elif t == 'set_topic':
-        channel = bot.get_channel(action['channel_id'])
-        if channel:
+async def _exec_set_permissions(action, context):
+    channel = bot.get_channel(action['channel_id'])
+    if channel:
+        guild = channel.guild
+        member = guild.get_member(action['user_id'])
+        if member:
+            perms = {}
+            for perm in action.get('allow', []):
+                perms[perm] = True
             try:
-                await channel.edit(topic=action['topic'])
-            except:
+                await channel.set_permissions(member, **perms)
+            except discord.Forbidden:
                 pass
 
-    elif t == 'send_embed_tracked':
-        channel = bot.get_channel(action['channel_id'])
-        if channel:
-            embed = _dict_to_embed(action['embed'])
-            msg = await channel.send(embed=embed)
-            # Save message_id to Application for in-place editing later
-            app_id = action.get('application_id')
-            if app_id and msg:
-                from core.models import Application
-                await db_call(
-                    Application.objects.filter(id=app_id).update,
-                    message_id=msg.id,
-                )
-            # Add reaction buttons
+
+async def _exec_set_topic(action, context):
+    channel = bot.get_channel(action['channel_id'])
+    if channel:
+        try:
+            await channel.edit(topic=action['topic'])
+        except:
+            pass
+
+
+async def _exec_send_embed_tracked(action, context):
+    channel = bot.get_channel(action['channel_id'])
+    if channel:
+        embed = _dict_to_embed(action['embed'])
+        msg = await channel.send(embed=embed)
+        # Save message_id to Application for in-place editing later
+        app_id = action.get('application_id')
+        if app_id and msg:
+            await db_call(
+                Application.objects.filter(id=app_id).update,
+                message_id=msg.id,
+            )
+        # Add reaction buttons
+        try:
+            for emoji in _REVIEW_EMOJIS:
+                await msg.add_reaction(emoji)
+        except:
+            pass
+
+
+async def _exec_cleanup_channel(action, context):
+    channel = bot.get_channel(action['channel_id'])
+    if channel:
+        # Get message IDs of pending applications (protected)
+        protected = set(await db_call(
+            lambda: list(Application.objects.filter(
+                guild__guild_id=action['guild_id'],
+                status='PENDING',
+                message_id__isnull=False,
+            ).values_list('message_id', flat=True))
+        ))
+        count = action.get('count', 50)
+        deleted = 0
+        async for msg in channel.history(limit=count * 3):
+            if msg.author.id != bot.user.id:
+                continue
+            if msg.id in protected:
+                continue
+            # Don't delete messages with pending embeds
+            if msg.embeds and msg.embeds[0].title and 'Application #' in msg.embeds[0].title:
+                if msg.embeds[0].color and msg.embeds[0].color.value == 0xFFA500:
+                    continue  # orange = still pending
             try:
-                await msg.add_reaction('\u2705')
-                await msg.add_reaction('\u274c')
+                # Slot held per delete only, never across the pacing sleep
+                async with _action_slots:
+                    await msg.delete()
+                deleted += 1
+                if deleted >= count:
+                    break
+                await asyncio.sleep(0.5)  # avoid Discord rate limits
             except:
                 pass
 
-    elif t == 'cleanup_channel':
-        channel = bot.get_channel(action['channel_id'])
-        if channel:
-            from core.models import Application
-            # Get message IDs of pending applications (protected)
-            protected = set(await db_call(
-                lambda: list(Application.objects.filter(
-                    guild__guild_id=action['guild_id'],
-                    status='PENDING',
-                    message_id__isnull=False,
-                ).values_list('message_id', flat=True))
-            ))
-            count = action.get('count', 50)
-            deleted = 0
-            async for msg in channel.history(limit=count * 3):
-                if msg.author.id != bot.user.id:
-                    continue
-                if msg.id in protected:
-                    continue
-                # Don't delete messages with pending embeds
-                if msg.embeds and msg.embeds[0].title and 'Application #' in msg.embeds[0].title:
-                    if msg.embeds[0].color and msg.embeds[0].color.value == 0xFFA500:
-                        continue  # orange = still pending
-                try:
-                    await msg.delete()
-                    deleted += 1
-                    if deleted >= count:
-                        break
-                    await asyncio.sleep(0.5)  # avoid Discord rate limits
-                except:
-                    pass
 
-    elif t == 'ensure_resources':
-        from core.models import GuildSettings
-        gs = await db_call(GuildSettings.objects.get, guild_id=action['guild_id'])
-        await ensure_required_resources(bot, gs)
+async def _exec_ensure_resources(action, context):
+    # Cached settings: when every resource resolves, this makes no DB call at all.
+    # Repairs mutate a copy (never the shared cached instance), save only the
+    # IDs they repaired, and then drop the cache entry so the next read is fresh
+    gs = copy.copy(await get_guild_settings(action['guild_id']))
+    before = gs.bot_admin_role_id, gs.pending_role_id, gs.bounce_channel_id, gs.pending_channel_id
+    await ensure_required_resources(bot, gs)
+    if (gs.bot_admin_role_id, gs.pending_role_id, gs.bounce_channel_id, gs.pending_channel_id) != before:
+        _guild_settings_cache.pop(gs.guild_id, None)
+
+
+_ACTION_EXECUTORS = {
+    'send_message': _exec_send_message,
+    'send_embed': _exec_send_embed,
+    'send_dm': _exec_send_dm,
+    'reply': _exec_reply,
+    'add_role': _exec_add_role,
+    'remove_role': _exec_remove_role,
+    'edit_message': _exec_edit_message,
+    'clear_reactions': _exec_clear_reactions,
+    'set_permissions': _exec_set_permissions,
+    'set_topic': _exec_set_topic,
+    'send_embed_tracked': _exec_send_embed_tracked,
+    'cleanup_channel': _exec_cleanup_channel,
+    'ensure_resources': _exec_ensure_resources,
+}
+
+
+async def _execute_one(action, context=None):
+    """Execute a single action dict."""
+    executor = _ACTION_EXECUTORS.get(action['type'])
+    if executor is None:
+        # Only the miss path pays for the suggestion
+        hint = difflib.get_close_matches(action['type'], _ACTION_EXECUTORS, n=1)
+        suffix = f' (did you mean {hint[0]!r}?)' if hint else ''
+        logger.warning('⚠️ Unknown action type %r%s', action['type'], suffix)
+        return
+    await executor(action, context)
 
 
 def _dict_to_embed(d):
@@ -275,12 +423,13 @@ async def detect_invite_used(guild):
         current_invites = await guild.invites()
         current_uses = {inv.code: inv.uses for inv in current_invites}
 
-        if guild.id not in invite_cache:
+        previous_uses = invite_cache.get(guild.id)
+        if previous_uses is None:
             invite_cache[guild.id] = current_uses
             return None
 
         for code, uses in current_uses.items():
-            if uses > invite_cache[guild.id].get(code, 0):
+            if uses > previous_uses.get(code, 0):
                 invite = discord.utils.get(current_invites, code=code)
                 invite_cache[guild.id] = current_uses
                 return {
@@ -292,7 +441,7 @@ async def detect_invite_used(guild):
         invite_cache[guild.id] = current_uses
         return None
     except Exception as e:
-        print(f'❌ Error detecting invite: {e}')
+        logger.error('❌ Error detecting invite: %s', e)
         return None
 
 
@@ -300,20 +449,20 @@ async def detect_invite_used(guild):
 
 @bot.event
 async def on_ready():
-    print(f'✅ Bot logged in as {bot.user.name}')
+    logger.info('✅ Bot logged in as %s', bot.user.name)
     for guild in bot.guilds:
         try:
             invites = await guild.invites()
             invite_cache[guild.id] = {inv.code: inv.uses for inv in invites}
-            print(f'📋 Cached {len(invites)} invites for {guild.name}')
+            logger.info('📋 Cached %d invites for %s', len(invites), guild.name)
         except Exception as e:
-            print(f'❌ Failed to cache invites for {guild.name}: {e}')
-    print('🚀 Bot is ready!')
+            logger.error('❌ Failed to cache invites for %s: %s', guild.name, e)
+    logger.info('🚀 Bot is ready!')
 
 
 @bot.event
 async def on_guild_join(guild):
-    print(f'🆕 Joined guild: {guild.name}')
+    logger.info('🆕 Joined guild: %s', guild.name)
     await setup_guild(bot, guild)
     try:
         invites = await guild.invites()
@@ -324,7 +473,7 @@ async def on_guild_join(guild):
 
 @bot.event
 async def on_guild_remove(guild):
-    print(f'👋 Left guild: {guild.name}')
+    logger.info('👋 Left guild: %s', guild.name)
     invite_cache.pop(guild.id, None)
 
 
@@ -350,9 +499,7 @@ async def on_member_remove(member):
 
 @bot.event
 async def on_invite_create(invite):
-    if invite.guild.id not in invite_cache:
-        invite_cache[invite.guild.id] = {}
-    invite_cache[invite.guild.id][invite.code] = invite.uses or 0
+    invite_cache.setdefault(invite.guild.id, {})[invite.code] = invite.uses or 0
 
 
 @bot.event
@@ -376,16 +523,12 @@ async def on_raw_reaction_add(payload):
     except:
         return
 
-    # Quick check: is this an application embed?
-    if not message.embeds or not message.embeds[0].title or 'Application #' not in message.embeds[0].title:
-        return
-
-    # Extract application ID from embed title
-    try:
-        title_part = message.embeds[0].title.split('#')[1]
-        app_id = int(title_part.split()[0].strip(' ——-'))
-    except:
+    # Only application embeds carry an ID in their title
+    title = message.embeds[0].title if message.embeds else None
+    match = _APP_TITLE_RE.search(title) if title else None
+    if not match:
         return
+    app_id = int(match.group(1))
 
     guild = bot.get_guild(payload.guild_id) if payload.guild_id else None
     if not guild:
@@ -396,14 +539,12 @@ async def on_raw_reaction_add(payload):
         return
 
     # Check admin role before calling service
-    from core.models import GuildSettings
     try:
-        gs = await db_call(GuildSettings.objects.get, guild_id=guild.id)
+        gs = await get_guild_settings(guild.id)
     except:
         return
 
-    admin_role = guild.get_role(gs.bot_admin_role_id)
-    if not admin_role or admin_role not in member.roles:
+    if not gs.bot_admin_role_id or member.get_role(gs.bot_admin_role_id) is None:
         try:
             await message.remove_reaction(payload.emoji, member)
         except:
@@ -411,7 +552,6 @@ async def on_raw_reaction_add(payload):
         return
 
     # Check applicant is still in guild
-    from core.models import Application
     try:
         app = await db_call(Application.objects.get, id=app_id, status='PENDING')
     except:
@@ -419,10 +559,8 @@ async def on_raw_reaction_add(payload):
 
     applicant = guild.get_member(app.user_id)
     if not applicant:
-        from bot.handlers.templates import get_template_async
         try:
-            gs_for_tpl = await db_call(GuildSettings.objects.get, guild_id=guild.id)
-            msg_text = await get_template_async(gs_for_tpl, 'USER_LEFT_SERVER')
+            msg_text = await get_template_async(gs, 'USER_LEFT_SERVER')
         except Exception:
             msg_text = "❌ User has left the server."
         await channel.send(msg_text)
@@ -498,8 +636,12 @@ async def on_message(message):
         # For commands that need guild data (reload, addrule)
         if command_name in ('reload', 'addrule'):
             event['guild_roles'] = [{'id': r.id, 'name': r.name} for r in message.guild.roles]
-            event['guild_channels'] = [{'id': c.id, 'name': c.name} for c in message.guild.text_channels]
         if command_name == 'reload':
+            # Single unsorted pass; text_channels would filter and sort by position
+            event['guild_channels'] = [
+                {'id': c.id, 'name': c.name}
+                for c in message.guild.channels if isinstance(c, discord.TextChannel)
+            ]
             event['guild_members'] = [{'id': m.id, 'name': str(m), 'bot': m.bot} for m in message.guild.members]
 
         # For bulk approve: members with the mentioned role
@@ -507,7 +649,7 @@ async def on_message(message):
             target_role = message.role_mentions[0]
             event['members_with_role'] = [
                 {'id': m.id, 'name': m.display_name}
-                for m in message.guild.members if target_role in m.roles
+                for m in target_role.members
             ]
     else:
         event['guild_id'] = None
@@ -515,22 +657,23 @@ async def on_message(message):
     # For getaccess: find guilds where user is admin
     if command_name == 'getaccess' and not message.guild:
         admin_guilds = []
-        from core.models import GuildSettings
-        all_gs = await db_call(lambda: list(GuildSettings.objects.filter(bot_admin_role_id__isnull=False)))
-        for gs in all_gs:
-            guild = bot.get_guild(gs.guild_id)
-            if not guild:
-                continue
-            member = guild.get_member(message.author.id)
-            if not member:
-                continue
-            if any(r.id == gs.bot_admin_role_id for r in member.roles):
-                admin_guilds.append({'guild_id': gs.guild_id, 'guild_name': guild.name})
+        # Only guilds the user is actually in need their settings loaded
+        members_by_guild = {}
+        for g in bot.guilds:
+            member = g.get_member(message.author.id)
+            if member:
+                members_by_guild[g.id] = member
+        admin_role_ids = await db_call(lambda: list(GuildSettings.objects.filter(
+            bot_admin_role_id__isnull=False, guild_id__in=list(members_by_guild),
+        ).values_list('guild_id', 'bot_admin_role_id')))
+        for guild_id, admin_role_id in admin_role_ids:
+            member = members_by_guild[guild_id]
+            if member.get_role(admin_role_id) is not None:
+                admin_guilds.append({'guild_id': guild_id, 'guild_name': member.guild.name})
 
         if len(admin_guilds) > 1:
             # Multi-guild selection flow
             guild_list = '\n'.join(f'**{i+1}.** {g["guild_name"]}' for i, g in enumerate(admin_guilds))
-            from bot.handlers.templates import get_template_async
             tpl = await get_template_async(None, 'GETACCESS_PICK_SERVER')
             await message.author.send(tpl.format(guild_list=guild_list))
 
@@ -560,6 +703,6 @@ async def on_message(message):
 if __name__ == '__main__':
     token = os.getenv('DISCORD_TOKEN')
     if not token:
-        print('❌ DISCORD_TOKEN not found in environment')
+        logger.error('❌ DISCORD_TOKEN not found in environment')
         sys.exit(1)
     bot.run(token)
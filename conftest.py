@@ -11,7 +11,18 @@ from core.models import (
     GuildSettings, DiscordRole, InviteRule,
     Application, Automation, Action,
 )
-from bot.handlers.templates import init_default_templates
+from core.services import clear_listfields_cache
+from bot.handlers.templates import init_default_templates, clear_template_cache
+
+
+@pytest.fixture(autouse=True)
+def _fresh_template_cache():
+    """Templates/listfields are cached per process; don't leak them across rolled-back tests."""
+    clear_template_cache()
+    clear_listfields_cache()
+    yield
+    clear_template_cache()
+    clear_listfields_cache()
 
 
 @pytest.fixture
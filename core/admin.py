@@ -20,7 +20,7 @@ class GuildSettingsAdmin(admin.ModelAdmin):
     list_filter = ('mode', 'language')
     readonly_fields = ('guild_id', 'created_at', 'updated_at')
     fieldsets = (
-        (None, {'fields': ('guild_id', 'guild_name', 'mode', 'language')}),
+        (None, {'fields': ('guild_id', 'guild_name', 'mode', 'language', 'dm_on_approval')}),
         ('Roles (auto-managed)', {
             'fields': ('bot_admin_role_id', 'pending_role_id'),
             'description': 'These are auto-created by the bot. Only edit if you know the Discord role IDs.',
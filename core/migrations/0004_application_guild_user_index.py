@@ -0,0 +1,18 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_update_template_choices_fix_sequences'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(
+                fields=['guild', 'user_id', 'status', '-created_at'],
+                name='applications_guild_user_idx',
+            ),
+        ),
+    ]
@@ -0,0 +1,15 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0004_application_guild_user_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='accesstoken',
+            index=models.Index(fields=['user_id', 'guild', 'expires_at'], name='access_tokens_user_guild_idx'),
+        ),
+    ]
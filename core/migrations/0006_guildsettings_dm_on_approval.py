@@ -0,0 +1,22 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0005_access_token_user_guild_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='guildsettings',
+            name='dm_on_approval',
+            field=models.BooleanField(
+                default=True,
+                help_text=(
+                    'DM users when they are approved. Turn off for mass onboarding: '
+                    'a notice mentioning the user is posted to #bounce instead.'
+                ),
+            ),
+        ),
+    ]
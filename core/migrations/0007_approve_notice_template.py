@@ -0,0 +1,72 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0006_guildsettings_dm_on_approval'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='guildsettings',
+            name='dm_on_approval',
+            field=models.BooleanField(
+                default=True,
+                help_text=(
+                    'DM users when they are approved. Turn off for mass onboarding: single '
+                    'approvals post a notice to #bounce instead, bulk approvals list users in the reply.'
+                ),
+            ),
+        ),
+        migrations.AlterField(
+            model_name='messagetemplate',
+            name='template_type',
+            field=models.CharField(
+                choices=[
+                    ('INSTALL_WELCOME', 'Setup – Welcome Message'),
+                    ('SETUP_DIAGNOSTIC', 'Setup – Role Hierarchy Warning'),
+                    ('JOIN_LOG_AUTO', 'Join Log (AUTO mode)'),
+                    ('JOIN_LOG_APPROVAL', 'Join Log (APPROVAL mode)'),
+                    ('PENDING_CHANNEL_TOPIC', 'Pending Channel – Topic (with form)'),
+                    ('PENDING_CHANNEL_TOPIC_NO_FORM', 'Pending Channel – Topic (no form)'),
+                    ('APPLICATION_SENT', 'Application Submitted'),
+                    ('APPLICATION_APPROVED', 'Application Approved'),
+                    ('APPLICATION_REJECTED', 'Application Rejected'),
+                    ('APPROVE_CONFIRM', 'Approve – Admin Confirmation'),
+                    ('APPROVE_DM', 'Approve – User DM'),
+                    ('APPROVE_NOTICE', 'Approve – #bounce Notice (DMs off)'),
+                    ('APPROVE_STATUS', 'Approve – Embed Status Field'),
+                    ('REJECT_CONFIRM', 'Reject – Admin Confirmation'),
+                    ('REJECT_DM', 'Reject – User DM'),
+                    ('REJECT_STATUS', 'Reject – Embed Status Field'),
+                    ('REJECT_PENDING', 'Reject – Pending Channel Notice'),
+                    ('APPROVAL_NOTIFICATION', 'Approval Channel Notification'),
+                    ('NO_PENDING_APP', 'No Pending Application'),
+                    ('BULK_APPROVE_RESULT', 'Bulk Approve – Result'),
+                    ('GETACCESS_RESPONSE', 'GetAccess Token Response'),
+                    ('GETACCESS_EXISTS', 'Token Already Exists'),
+                    ('GETACCESS_NO_ADMIN', 'GetAccess – Not Admin'),
+                    ('GETACCESS_PICK_SERVER', 'GetAccess – Pick Server'),
+                    ('HELP_MESSAGE', 'Help Command'),
+                    ('COMMAND_SUCCESS', 'Command Success'),
+                    ('COMMAND_ERROR', 'Command Error'),
+                    ('COMMAND_NOT_FOUND', 'Command Not Found'),
+                    ('COMMAND_DISABLED', 'Command Disabled'),
+                    ('LISTRULES_EMPTY', 'List Rules – Empty'),
+                    ('LISTFIELDS_EMPTY', 'List Fields – Empty'),
+                    ('CLEANUP_REPLY', 'Cleanup – Confirmation'),
+                    ('CLEANALL_REPLY', 'Clean All – Confirmation'),
+                    ('ADMIN_REQUIRED', 'Admin Required Warning'),
+                    ('SERVER_NOT_CONFIGURED', 'Server Not Configured'),
+                    ('DM_ONLY_WARNING', 'DM-Only Warning'),
+                    ('SERVER_ONLY_WARNING', 'Server-Only Warning'),
+                    ('USER_LEFT_SERVER', 'User Left Server'),
+                    ('AUTO_TRANSLATE_ON', 'Auto-Translate Enabled'),
+                    ('AUTO_TRANSLATE_OFF', 'Auto-Translate Disabled'),
+                ],
+                max_length=50,
+                unique=True,
+            ),
+        ),
+    ]
@@ -27,6 +27,14 @@ class GuildSettings(models.Model):
         help_text='Auto-translate language code (e.g. fr, es, de). Leave blank for English.',
     )
 
+    dm_on_approval = models.BooleanField(
+        default=True,
+        help_text=(
+            'DM users when they are approved. Turn off for mass onboarding: single '
+            'approvals post a notice to #bounce instead, bulk approvals list users in the reply.'
+        ),
+    )
+
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -144,10 +152,30 @@ class Action(models.Model):
     )
     enabled = models.BooleanField(default=True)
 
+    # Config keys holding Discord IDs; JSON editors often store these as strings.
+    # Shorter digit strings are left alone: they are names (e.g. a role "2024")
+    SNOWFLAKE_KEYS = ('channel', 'role', 'role_id')
+    SNOWFLAKE_MIN_DIGITS = 15
+
     class Meta:
         db_table = 'actions'
         ordering = ['order']
 
+    def normalize_config(self):
+        """Coerce numeric-string IDs in config to int once, so the engine can use them as-is."""
+        if isinstance(self.config, dict):
+            for key in self.SNOWFLAKE_KEYS:
+                value = self.config.get(key)
+                if isinstance(value, str):
+                    value = value.strip()
+                    if value.isdigit() and len(value) >= self.SNOWFLAKE_MIN_DIGITS:
+                        self.config[key] = int(value)
+
+    def save(self, *args, **kwargs):
+        # bulk_create skips save(); callers there call normalize_config() themselves
+        self.normalize_config()
+        super().save(*args, **kwargs)
+
     def __str__(self):
         return f"{self.automation.name} → {self.get_action_type_display()} (#{self.order})"
 
@@ -196,11 +224,12 @@ class Dropdown(models.Model):
         return f"{self.name} [{self.get_source_type_display()}]{multi}"
 
     def get_options(self):
+        # .all() reuses prefetched roles/channels/custom_options when present
         if self.source_type == 'ROLES':
-            qs = self.roles.all() if self.roles.exists() else DiscordRole.objects.filter(guild=self.guild)
+            qs = list(self.roles.all()) or DiscordRole.objects.filter(guild_id=self.guild_id)
             return [{'label': r.name, 'value': str(r.discord_id)} for r in qs]
         elif self.source_type == 'CHANNELS':
-            qs = self.channels.all() if self.channels.exists() else DiscordChannel.objects.filter(guild=self.guild)
+            qs = list(self.channels.all()) or DiscordChannel.objects.filter(guild_id=self.guild_id)
             return [{'label': c.name or f'#{c.discord_id}', 'value': str(c.discord_id)} for c in qs]
         else:
             return [{'label': o.label, 'value': o.value} for o in self.custom_options.all()]
@@ -278,6 +307,10 @@ class Application(models.Model):
     class Meta:
         db_table = 'applications'
         ordering = ['-created_at']
+        indexes = [
+            # Pending-application lookups by (guild, user) on every approve/reject/join
+            models.Index(fields=['guild', 'user_id', 'status', '-created_at'], name='applications_guild_user_idx'),
+        ]
 
     def __str__(self):
         return f"{self.user_name} - {self.status}"
@@ -303,6 +336,7 @@ class MessageTemplate(models.Model):
         # ── Approve / Reject ──
         ('APPROVE_CONFIRM', 'Approve – Admin Confirmation'),
         ('APPROVE_DM', 'Approve – User DM'),
+        ('APPROVE_NOTICE', 'Approve – #bounce Notice (DMs off)'),
         ('APPROVE_STATUS', 'Approve – Embed Status Field'),
         ('REJECT_CONFIRM', 'Reject – Admin Confirmation'),
         ('REJECT_DM', 'Reject – User DM'),
@@ -376,6 +410,10 @@ class AccessToken(models.Model):
 
     class Meta:
         db_table = 'access_tokens'
+        indexes = [
+            # getaccess reuses a user's unexpired token for the guild
+            models.Index(fields=['user_id', 'guild', 'expires_at'], name='access_tokens_user_guild_idx'),
+        ]
 
     def is_valid(self):
         return timezone.now() < self.expires_at
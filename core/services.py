@@ -17,16 +17,60 @@ Action dict types:
 """
 
 import os
+import re
 import secrets
+import time
 from datetime import timedelta
 
+from django.db import transaction
+from django.db.models import Prefetch
+from django.db.models.signals import m2m_changed, post_delete, post_save
 from django.utils import timezone
 
 from .models import (
     GuildSettings, DiscordRole, DiscordChannel, InviteRule,
-    Application, FormField, AccessToken, Automation,
+    Application, Dropdown, DropdownOption, FormField, AccessToken, Automation, Action,
 )
-from bot.handlers.templates import get_template
+from bot.handlers.templates import clear_template_cache, get_template
+
+# Public base URL of the web app (form + admin login links), resolved once
+_APP_URL = os.environ.get('APP_URL', 'https://your-domain.com').rstrip('/')
+if not _APP_URL.startswith(('http://', 'https://')):
+    _APP_URL = f'https://{_APP_URL}'
+_LOGIN_URL_PREFIX = f'{_APP_URL}/auth/login/?token='
+
+# Discord snowflake IDs inside a comma-separated dropdown response
+_ID_RE = re.compile(r'\d+')
+
+# Choice labels for listfields, resolved once instead of get_FOO_display() per row
+_FIELD_TYPE_DISPLAY = dict(FormField.FIELD_TYPES)
+_SOURCE_TYPE_DISPLAY = dict(Dropdown.SOURCE_TYPES)
+
+# Discord embed limits (title excluded from the character budget below)
+_EMBED_MAX_FIELDS = 25
+_EMBED_MAX_VALUE = 1024
+_EMBED_MAX_CHARS = 5900
+
+# Rows streamed/written per batch when mirroring guild roles/channels
+_SYNC_CHUNK_SIZE = 500
+
+# Rendered listfields embed fields per guild, dropped whenever form data changes
+_LISTFIELDS_CACHE_TTL = 60
+_listfields_cache = {}
+
+
+def clear_listfields_cache(**kwargs):
+    """Drop all cached listfields output (also used as a signal receiver)."""
+    _listfields_cache.clear()
+
+
+for _model in (FormField, Dropdown, DropdownOption, DiscordRole, DiscordChannel):
+    for _signal, _suffix in ((post_save, 'save'), (post_delete, 'delete')):
+        _signal.connect(clear_listfields_cache, sender=_model,
+                        dispatch_uid=f'listfields_cache_{_model.__name__}_{_suffix}')
+for _through in (Dropdown.roles.through, Dropdown.channels.through):
+    m2m_changed.connect(clear_listfields_cache, sender=_through,
+                        dispatch_uid=f'listfields_cache_{_through.__name__}_m2m')
 
 
 # ── Helpers ──────────────────────────────────────────────────────────────────
@@ -38,6 +82,13 @@ def _get_guild(guild_id):
         return None
 
 
+def _enabled_actions():
+    """Prefetch for Automation.actions: enabled only, in execution order."""
+    return Prefetch('actions', queryset=(
+        Action.objects.filter(enabled=True).only('automation', 'action_type', 'config').order_by('order')
+    ))
+
+
 def _resolve_channel(gs, ref):
     """Map a channel reference ('bounce', 'pending', or int) to a channel ID."""
     if not ref:
@@ -66,6 +117,18 @@ def _resolve_role_id(gs, config):
     return None
 
 
+def _invite_rule_for(gs, invite_code):
+    """Rule for an invite code, else the guild's 'default' rule; both fetched in one query."""
+    rules = {
+        rule.invite_code: rule
+        for rule in InviteRule.objects.prefetch_related(
+            Prefetch('roles', queryset=DiscordRole.objects.only('discord_id', 'name'))
+        ).filter(
+            guild=gs, invite_code__in=[invite_code, 'default'])
+    }
+    return rules.get(invite_code) or rules.get('default')
+
+
 def _resolve_display_value(field, raw_value):
     """Resolve dropdown IDs to human-readable names."""
     if not raw_value or raw_value == 'No answer':
@@ -102,9 +165,9 @@ def _resolve_display_value(field, raw_value):
 
 def _extract_form_selections(gs, application):
     """Extract role IDs and channel IDs from dropdown responses."""
-    fields = FormField.objects.select_related('dropdown').filter(
-        guild=gs, field_type='dropdown',
-    )
+    fields = FormField.objects.select_related('dropdown').only(
+        'id', 'dropdown__source_type',
+    ).filter(guild=gs, field_type='dropdown')
     role_ids, channel_ids = [], []
     for field in fields:
         if not field.dropdown:
@@ -112,16 +175,11 @@ def _extract_form_selections(gs, application):
         raw = application.responses.get(str(field.id), '')
         if not raw:
             continue
-        for val in raw.split(','):
-            val = val.strip()
-            try:
-                int_val = int(val)
-            except ValueError:
-                continue
-            if field.dropdown.source_type == 'ROLES':
-                role_ids.append(int_val)
-            elif field.dropdown.source_type == 'CHANNELS':
-                channel_ids.append(int_val)
+        source = field.dropdown.source_type
+        if source == 'ROLES':
+            role_ids.extend(map(int, _ID_RE.findall(raw)))
+        elif source == 'CHANNELS':
+            channel_ids.extend(map(int, _ID_RE.findall(raw)))
     return role_ids, channel_ids
 
 
@@ -138,117 +196,142 @@ def process_event(trigger_type, event):
 
     automations = Automation.objects.filter(
         guild=gs, trigger=trigger_type, enabled=True,
-    ).prefetch_related('actions')
+    ).only('trigger_config', 'admin_only').prefetch_related(_enabled_actions())
 
     results = []
     for auto in automations:
         if not _trigger_matches(auto.trigger_config, event):
             continue
-        for action in auto.actions.filter(enabled=True).order_by('order'):
+        for action in auto.actions.all():
             results.extend(_process_action(action, gs, event))
     return results
 
 
+# trigger_config key -> how to read the matching value from an event
+_TRIGGER_FIELDS = {
+    'mode': lambda event: event.get('mode'),
+    'invite_code': lambda event: event.get('invite', {}).get('code'),
+    'name': lambda event: event.get('command'),
+    'emoji': lambda event: event.get('emoji'),
+}
+
+
 def _trigger_matches(config, event):
     """Return True if every key in trigger_config matches the event."""
     if not config:
         return True
     for key, value in config.items():
-        if key == 'mode' and event.get('mode') != value:
-            return False
-        if key == 'invite_code' and event.get('invite', {}).get('code') != value:
-            return False
-        if key == 'name' and event.get('command') != value:
-            return False
-        if key == 'emoji' and event.get('emoji') != value:
+        getter = _TRIGGER_FIELDS.get(key)
+        if getter and getter(event) != value:
             return False
     return True
 
 
 def _process_action(action, gs, event):
     """Convert an Action model instance into bot action dicts."""
-    c = action.config or {}
-    t = action.action_type
+    builder = _ACTION_BUILDERS.get(action.action_type)
+    if not builder:
+        return []
     member = event.get('member', {})
     user_id = member.get('id') or event.get('user_id')
+    return builder(gs, event, action.config or {}, user_id)
 
-    if t == 'SEND_MESSAGE':
-        ch = _resolve_channel(gs, c.get('channel', 'bounce'))
-        tpl_name = c.get('template')
-        content = c.get('content', '')
-        if tpl_name:
-            content = _format_template(gs, tpl_name, event)
-        return [{'type': 'send_message', 'channel_id': ch, 'content': content}] if ch and content else []
-
-    if t == 'SEND_DM':
-        tpl_name = c.get('template')
-        content = c.get('content', '')
-        if tpl_name:
-            content = _format_template(gs, tpl_name, event)
-        return [{'type': 'send_dm', 'user_id': user_id, 'content': content}] if user_id and content else []
-
-    if t == 'SEND_EMBED':
-        ch = _resolve_channel(gs, c.get('channel', 'bounce'))
-        if not ch:
-            return []
-        tpl_name = c.get('template', '')
-        track = c.get('track', False)
-
-        # Special case: 'application' template builds the application embed
-        if tpl_name == 'application':
-            return _build_application_embed(gs, event, ch, track)
-
-        # Generic log embeds
-        if tpl_name:
-            text = _format_template(gs, tpl_name, event)
-            embed = {'description': text, 'color': c.get('color', 0x2ecc71)}
-            return [{'type': 'send_embed', 'channel_id': ch, 'embed': embed}]
-        return []
 
-    if t == 'ADD_ROLE':
-        if c.get('from_rule'):
-            return _roles_from_invite_rule(gs, event)
-        if c.get('from_form'):
-            return _roles_from_form(gs, event)
-        role_id = _resolve_role_id(gs, c)
-        if role_id and user_id:
-            return [{'type': 'add_role', 'guild_id': gs.guild_id, 'user_id': user_id,
-                     'role_id': role_id, 'reason': c.get('reason', '')}]
-        return []
+def _build_send_message(gs, event, c, user_id):
+    ch = _resolve_channel(gs, c.get('channel', 'bounce'))
+    tpl_name = c.get('template')
+    content = c.get('content', '')
+    if tpl_name:
+        content = _format_template(gs, tpl_name, event)
+    return [{'type': 'send_message', 'channel_id': ch, 'content': content}] if ch and content else []
 
-    if t == 'REMOVE_ROLE':
-        role_id = _resolve_role_id(gs, c)
-        if role_id and user_id:
-            return [{'type': 'remove_role', 'guild_id': gs.guild_id, 'user_id': user_id, 'role_id': role_id}]
-        return []
 
-    if t == 'SET_TOPIC':
-        ch = _resolve_channel(gs, c.get('channel', 'pending'))
-        tpl_name = c.get('template')
-        content = c.get('content', '')
-        if tpl_name:
-            content = _format_template(gs, tpl_name, event)
-        return [{'type': 'set_topic', 'channel_id': ch, 'topic': content}] if ch else []
-
-    if t == 'SET_PERMS':
-        if c.get('from_form'):
-            return _channel_perms_from_form(gs, event)
-        ch = _resolve_channel(gs, c.get('channel'))
-        if ch and user_id:
-            return [{'type': 'set_permissions', 'channel_id': ch, 'user_id': user_id,
-                     'allow': c.get('allow', ['read_messages', 'send_messages'])}]
-        return []
+def _build_send_dm(gs, event, c, user_id):
+    tpl_name = c.get('template')
+    content = c.get('content', '')
+    if tpl_name:
+        content = _format_template(gs, tpl_name, event)
+    return [{'type': 'send_dm', 'user_id': user_id, 'content': content}] if user_id and content else []
+
 
-    if t == 'CLEANUP':
-        ch = _resolve_channel(gs, c.get('channel', 'bounce'))
-        if ch:
-            return [{'type': 'cleanup_channel', 'channel_id': ch,
-                     'count': c.get('count', 10), 'guild_id': gs.guild_id}]
+def _build_send_embed(gs, event, c, user_id):
+    ch = _resolve_channel(gs, c.get('channel', 'bounce'))
+    if not ch:
         return []
+    tpl_name = c.get('template', '')
+    track = c.get('track', False)
+
+    # Special case: 'application' template builds the application embed
+    if tpl_name == 'application':
+        return _build_application_embed(gs, event, ch, track)
+
+    # Generic log embeds
+    if tpl_name:
+        text = _format_template(gs, tpl_name, event)
+        embed = {'description': text, 'color': c.get('color', 0x2ecc71)}
+        return [{'type': 'send_embed', 'channel_id': ch, 'embed': embed}]
+    return []
+
+
+def _build_add_role(gs, event, c, user_id):
+    if c.get('from_rule'):
+        return _roles_from_invite_rule(gs, event)
+    if c.get('from_form'):
+        return _roles_from_form(gs, event)
+    role_id = _resolve_role_id(gs, c)
+    if role_id and user_id:
+        return [{'type': 'add_role', 'guild_id': gs.guild_id, 'user_id': user_id,
+                 'role_id': role_id, 'reason': c.get('reason', '')}]
+    return []
+
+
+def _build_remove_role(gs, event, c, user_id):
+    role_id = _resolve_role_id(gs, c)
+    if role_id and user_id:
+        return [{'type': 'remove_role', 'guild_id': gs.guild_id, 'user_id': user_id, 'role_id': role_id}]
+    return []
 
+
+def _build_set_topic(gs, event, c, user_id):
+    ch = _resolve_channel(gs, c.get('channel', 'pending'))
+    tpl_name = c.get('template')
+    content = c.get('content', '')
+    if tpl_name:
+        content = _format_template(gs, tpl_name, event)
+    return [{'type': 'set_topic', 'channel_id': ch, 'topic': content}] if ch else []
+
+
+def _build_set_perms(gs, event, c, user_id):
+    if c.get('from_form'):
+        return _channel_perms_from_form(gs, event)
+    ch = _resolve_channel(gs, c.get('channel'))
+    if ch and user_id:
+        return [{'type': 'set_permissions', 'channel_id': ch, 'user_id': user_id,
+                 'allow': c.get('allow', ['read_messages', 'send_messages'])}]
+    return []
+
+
+def _build_cleanup(gs, event, c, user_id):
+    ch = _resolve_channel(gs, c.get('channel', 'bounce'))
+    if ch:
+        return [{'type': 'cleanup_channel', 'channel_id': ch,
+                 'count': c.get('count', 10), 'guild_id': gs.guild_id}]
     return []
 
 
+# Action.action_type → builder(gs, event, config, user_id) -> [action dicts]
+_ACTION_BUILDERS = {
+    'SEND_MESSAGE': _build_send_message,
+    'SEND_DM': _build_send_dm,
+    'SEND_EMBED': _build_send_embed,
+    'ADD_ROLE': _build_add_role,
+    'REMOVE_ROLE': _build_remove_role,
+    'SET_TOPIC': _build_set_topic,
+    'SET_PERMS': _build_set_perms,
+    'CLEANUP': _build_cleanup,
+}
+
+
 # ── Automation action helpers ────────────────────────────────────────────────
 
 def _format_template(gs, template_name, event):
@@ -287,10 +370,7 @@ def _build_application_embed(gs, event, channel_id, track):
     )
 
     has_form = FormField.objects.filter(guild=gs).exists()
-    app_url = os.environ.get('APP_URL', 'https://your-domain.com').rstrip('/')
-    if not app_url.startswith(('http://', 'https://')):
-        app_url = f'https://{app_url}'
-    form_url = f"{app_url}/form/{gs.guild_id}/"
+    form_url = f"{_APP_URL}/form/{gs.guild_id}/"
 
     embed = {
         'title': f'\U0001f4cb Application #{app.id} \u2014 {app.user_name}',
@@ -338,9 +418,7 @@ def _roles_from_invite_rule(gs, event):
     if not user_id:
         return []
 
-    rule = InviteRule.objects.prefetch_related('roles').filter(guild=gs, invite_code=code).first()
-    if not rule:
-        rule = InviteRule.objects.prefetch_related('roles').filter(guild=gs, invite_code='default').first()
+    rule = _invite_rule_for(gs, code)
     if not rule:
         return []
 
@@ -405,26 +483,33 @@ def handle_reaction(event):
     app_id = event.get('application_id')
     if not app_id:
         return []
-    try:
-        application = Application.objects.get(id=app_id, status='PENDING')
-    except Application.DoesNotExist:
-        return []
-
     gs = _get_guild(event['guild_id'])
     if not gs:
         return []
 
-    admin = event['admin']
-    if emoji == '\u2705':
-        actions, _ = _approve_user(gs, application, admin, event)
-        return actions
-    return _reject_user(gs, application, admin, event, reason='Rejected via reaction')
+    # Lock the row so a concurrent reaction/command can't review it twice
+    with transaction.atomic():
+        try:
+            application = Application.objects.select_for_update().get(id=app_id, status='PENDING')
+        except Application.DoesNotExist:
+            return []
+
+        admin = event['admin']
+        if emoji == '\u2705':
+            actions, _ = _approve_user(gs, application, admin, event)
+            return actions
+        return _reject_user(gs, application, admin, event, reason='Rejected via reaction')
 
 
 # ── Shared approve / reject ─────────────────────────────────────────────────
 
-def _approve_user(gs, application, admin, event, extra_role_ids=None, extra_channel_ids=None):
-    """Core approval logic - used by both commands and reactions."""
+def _approve_user(gs, application, admin, event, extra_role_ids=None, extra_channel_ids=None,
+                  bounce_notice=True):
+    """Core approval logic - used by both commands and reactions.
+
+    bounce_notice=False skips the #bounce notice that replaces the DM when
+    dm_on_approval is off (bulk approve lists everyone in its reply instead).
+    """
     actions = []
     user_id = application.user_id
 
@@ -434,11 +519,7 @@ def _approve_user(gs, application, admin, event, extra_role_ids=None, extra_chan
                         'user_id': user_id, 'role_id': gs.pending_role_id})
 
     # Roles from invite rule
-    rule = InviteRule.objects.prefetch_related('roles').filter(
-        guild=gs, invite_code=application.invite_code).first()
-    if not rule:
-        rule = InviteRule.objects.prefetch_related('roles').filter(
-            guild=gs, invite_code='default').first()
+    rule = _invite_rule_for(gs, application.invite_code)
 
     assigned_names = []
     rule_role_ids = set()
@@ -451,31 +532,41 @@ def _approve_user(gs, application, admin, event, extra_role_ids=None, extra_chan
 
     # Roles + channels from form (if user filled it)
     all_channel_ids = set()
+    form_role_ids = []
     if application.responses:
         role_ids, channel_ids = _extract_form_selections(gs, application)
-        for rid in role_ids:
-            if rid not in rule_role_ids:
-                actions.append({'type': 'add_role', 'guild_id': gs.guild_id, 'user_id': user_id, 'role_id': rid})
-                db_r = DiscordRole.objects.filter(guild=gs, discord_id=rid).first()
-                assigned_names.append(db_r.name if db_r else str(rid))
-        for cid in channel_ids:
-            all_channel_ids.add(cid)
+        form_role_ids = [rid for rid in role_ids if rid not in rule_role_ids]
+        all_channel_ids.update(channel_ids)
 
     # Extra channels from #mentions in approve command (appended)
-    for cid in (extra_channel_ids or []):
-        all_channel_ids.add(cid)
+    all_channel_ids.update(extra_channel_ids or [])
+
+    # Extra roles from @mentions in approve command, skipping ones already added
+    added_role_ids = rule_role_ids.union(form_role_ids)
+    new_extra_role_ids = []
+    for rid in (extra_role_ids or []):
+        if rid not in added_role_ids:
+            added_role_ids.add(rid)
+            new_extra_role_ids.append(rid)
+
+    # Resolve cached names for form/extra roles in one query
+    lookup_ids = form_role_ids + new_extra_role_ids
+    cached_names = dict(
+        DiscordRole.objects.filter(guild=gs, discord_id__in=lookup_ids).values_list('discord_id', 'name')
+    ) if lookup_ids else {}
+
+    for rid in form_role_ids:
+        actions.append({'type': 'add_role', 'guild_id': gs.guild_id, 'user_id': user_id, 'role_id': rid})
+        assigned_names.append(cached_names.get(rid, str(rid)))
 
     # Grant channel access for all collected channels
     for cid in all_channel_ids:
         actions.append({'type': 'set_permissions', 'channel_id': cid, 'user_id': user_id,
                        'allow': ['read_messages', 'send_messages']})
 
-    # Extra roles from @mentions in approve command (appended)
-    for rid in (extra_role_ids or []):
-        if not any(a.get('role_id') == rid for a in actions if a['type'] == 'add_role'):
-            actions.append({'type': 'add_role', 'guild_id': gs.guild_id, 'user_id': user_id, 'role_id': rid})
-            db_r = DiscordRole.objects.filter(guild=gs, discord_id=rid).first()
-            assigned_names.append(db_r.name if db_r else str(rid))
+    for rid in new_extra_role_ids:
+        actions.append({'type': 'add_role', 'guild_id': gs.guild_id, 'user_id': user_id, 'role_id': rid})
+        assigned_names.append(cached_names.get(rid, str(rid)))
 
     roles_str = ', '.join(assigned_names) or 'no specific roles'
 
@@ -484,9 +575,7 @@ def _approve_user(gs, application, admin, event, extra_role_ids=None, extra_chan
     if msg_id and gs.bounce_channel_id:
         original = event.get('original_embed', {})
         original['color'] = 0x2ecc71  # green
-        if 'fields' not in original:
-            original['fields'] = []
-        original['fields'] = [f for f in original['fields'] if f.get('name') != 'Actions']
+        original['fields'] = [f for f in original.get('fields', []) if f.get('name') != 'Actions']
         status_tpl = get_template(gs, 'APPROVE_STATUS')
         original['fields'].append({'name': 'Status', 'value': status_tpl.format(admin=admin['name']), 'inline': False})
         original['fields'].append({'name': 'Roles', 'value': roles_str, 'inline': False})
@@ -494,16 +583,24 @@ def _approve_user(gs, application, admin, event, extra_role_ids=None, extra_chan
                        'message_id': msg_id, 'embed': original})
         actions.append({'type': 'clear_reactions', 'channel_id': gs.bounce_channel_id, 'message_id': msg_id})
 
-    # DM user
-    tpl = get_template(gs, 'APPROVE_DM')
-    actions.append({'type': 'send_dm', 'user_id': user_id,
-                   'content': tpl.format(server=gs.guild_name, roles=roles_str)})
+    # DM user; guilds onboarding in bulk can turn this off
+    if gs.dm_on_approval:
+        tpl = get_template(gs, 'APPROVE_DM')
+        actions.append({'type': 'send_dm', 'user_id': user_id,
+                       'content': tpl.format(server=gs.guild_name, roles=roles_str)})
 
     # Cleanup old bot messages in bounce
     if gs.bounce_channel_id:
         actions.append({'type': 'cleanup_channel', 'channel_id': gs.bounce_channel_id,
                        'count': 50, 'guild_id': gs.guild_id})
 
+        # No DM: leave a notice mentioning the user instead. Queued after the
+        # cleanup (same channel lane), which would otherwise delete it
+        if not gs.dm_on_approval and bounce_notice:
+            tpl = get_template(gs, 'APPROVE_NOTICE')
+            actions.append({'type': 'send_message', 'channel_id': gs.bounce_channel_id,
+                           'content': tpl.format(user=f'<@{user_id}>', admin=admin['name'], roles=roles_str)})
+
     # Collect channel names for summary
     channel_names = []
     for cid in all_channel_ids:
@@ -524,7 +621,7 @@ def _reject_user(gs, application, admin, event, reason='No reason provided'):
     application.reviewed_by = admin['id']
     application.reviewed_by_name = admin['name']
     application.reviewed_at = timezone.now()
-    application.save()
+    application.save(update_fields=['status', 'reviewed_by', 'reviewed_by_name', 'reviewed_at'])
 
     # Remove Pending role
     if gs.pending_role_id:
@@ -536,9 +633,7 @@ def _reject_user(gs, application, admin, event, reason='No reason provided'):
     if msg_id and gs.bounce_channel_id:
         original = event.get('original_embed', {})
         original['color'] = 0xe74c3c  # red
-        if 'fields' not in original:
-            original['fields'] = []
-        original['fields'] = [f for f in original['fields'] if f.get('name') != 'Actions']
+        original['fields'] = [f for f in original.get('fields', []) if f.get('name') != 'Actions']
         status_tpl = get_template(gs, 'REJECT_STATUS')
         original['fields'].append({'name': 'Status', 'value': status_tpl.format(admin=admin['name']), 'inline': False})
         if reason and reason != 'No reason provided':
@@ -608,7 +703,7 @@ def handle_command(event):
     # Custom automations with trigger=COMMAND
     autos = Automation.objects.filter(
         guild=gs, trigger='COMMAND', enabled=True,
-    ).prefetch_related('actions')
+    ).only('trigger_config', 'admin_only').prefetch_related(_enabled_actions())
 
     for auto in autos:
         cfg_name = (auto.trigger_config or {}).get('name', '')
@@ -620,7 +715,7 @@ def handle_command(event):
                     tpl = get_template(gs, 'COMMAND_ERROR')
                     return [{'type': 'reply', 'content': tpl.format(message=str(e))}]
             results = []
-            for action in auto.actions.filter(enabled=True).order_by('order'):
+            for action in auto.actions.all():
                 results.extend(_process_action(action, gs, event))
             return results
 
@@ -665,8 +760,21 @@ def _cmd_help(gs, event):
         commands='\n'.join(lines), bot_mention='@Bot')}]
 
 
+def _get_or_create_roles(gs, items):
+    """DiscordRole rows for [{'id', 'name'}] in order, inserting missing ones in one batch."""
+    DiscordRole.objects.bulk_create(
+        [DiscordRole(discord_id=r['id'], guild=gs, name=r['name']) for r in items],
+        ignore_conflicts=True,
+    )
+    clear_listfields_cache()  # bulk writes don't send post_save
+    by_id = {
+        role.discord_id: role
+        for role in DiscordRole.objects.filter(guild=gs, discord_id__in=[r['id'] for r in items])
+    }
+    return [by_id[r['id']] for r in items]
+
+
 def _cmd_addrule(gs, event):
-    import re
     args = event['args']
     _require_admin(gs, event['author']['role_ids'])
     if len(args) < 1:
@@ -677,11 +785,7 @@ def _cmd_addrule(gs, event):
 
     if role_mentions:
         # Primary path: @role mentions
-        roles_to_add = []
-        for r in role_mentions:
-            db_role, _ = DiscordRole.objects.get_or_create(
-                discord_id=r['id'], guild=gs, defaults={'name': r['name']})
-            roles_to_add.append(db_role)
+        roles_to_add = _get_or_create_roles(gs, role_mentions)
         # Description = remaining args that aren't the invite code or mention patterns
         desc_parts = [a for a in args[1:] if not re.match(r'<@&\d+>', a)]
         description = ' '.join(desc_parts)
@@ -691,15 +795,14 @@ def _cmd_addrule(gs, event):
             raise _CmdError("Usage: `@Bot addrule <invite_code> @Role1 @Role2 ... [description]`")
         role_names = args[1].split(',')
         guild_roles = {r['name'].lower(): r for r in event.get('guild_roles', [])}
-        roles_to_add = []
+        found = []
         for name in role_names:
             name = name.strip()
             r = guild_roles.get(name.lower())
             if not r:
                 raise _CmdError(f"Role not found: `{name}`")
-            db_role, _ = DiscordRole.objects.get_or_create(
-                discord_id=r['id'], guild=gs, defaults={'name': r['name']})
-            roles_to_add.append(db_role)
+            found.append(r)
+        roles_to_add = _get_or_create_roles(gs, found)
         description = ' '.join(args[2:]) if len(args) > 2 else ''
 
     if not roles_to_add:
@@ -709,7 +812,7 @@ def _cmd_addrule(gs, event):
         guild=gs, invite_code=invite_code, defaults={'description': description})
     if description and rule.description != description:
         rule.description = description
-        rule.save()
+        rule.save(update_fields=['description'])
     rule.roles.set(roles_to_add)
 
     role_str = ', '.join(r.name for r in roles_to_add)
@@ -722,27 +825,29 @@ def _cmd_delrule(gs, event):
     _require_admin(gs, event['author']['role_ids'])
     if len(args) < 1:
         raise _CmdError("Usage: `@Bot delrule <invite_code>`")
-    try:
-        rule = InviteRule.objects.get(guild=gs, invite_code=args[0])
-        rule.delete()
-        tpl = get_template(gs, 'COMMAND_SUCCESS')
-        return [{'type': 'reply', 'content': tpl.format(message=f'Invite rule deleted: `{args[0]}`')}]
-    except InviteRule.DoesNotExist:
+    deleted, _ = InviteRule.objects.filter(guild=gs, invite_code=args[0]).delete()
+    if not deleted:
         raise _CmdError(f"Rule not found: `{args[0]}`")
+    tpl = get_template(gs, 'COMMAND_SUCCESS')
+    return [{'type': 'reply', 'content': tpl.format(message=f'Invite rule deleted: `{args[0]}`')}]
 
 
 def _cmd_listrules(gs, event):
-    rules = InviteRule.objects.filter(guild=gs).prefetch_related('roles')
-    if not rules.exists():
+    rules = list(
+        InviteRule.objects.filter(guild=gs)
+        .only('invite_code', 'description')
+        .prefetch_related(Prefetch('roles', queryset=DiscordRole.objects.only('name')))
+    )
+    if not rules:
         return [{'type': 'reply', 'content': get_template(gs, 'LISTRULES_EMPTY')}]
-    embed = {'title': '\U0001f4cb Invite Rules', 'color': 0x3498db, 'fields': []}
+    embed_fields = []
     for rule in rules:
         role_names = ', '.join(r.name for r in rule.roles.all())
         val = f"**Roles:** {role_names or 'None'}"
         if rule.description:
             val += f"\n*{rule.description}*"
-        embed['fields'].append({'name': f'`{rule.invite_code}`', 'value': val, 'inline': False})
-    return [{'type': 'send_embed', 'channel_id': event['channel_id'], 'embed': embed}]
+        embed_fields.append({'name': f'`{rule.invite_code}`', 'value': val[:_EMBED_MAX_VALUE], 'inline': False})
+    return _paged_embed_actions(event['channel_id'], '\U0001f4cb Invite Rules', embed_fields)
 
 
 def _cmd_setmode(gs, event):
@@ -754,8 +859,9 @@ def _cmd_setmode(gs, event):
     if mode not in ('AUTO', 'APPROVAL'):
         raise _CmdError("Mode must be AUTO or APPROVAL")
     old = gs.mode
-    gs.mode = mode
-    gs.save()
+    if mode != old:
+        gs.mode = mode
+        gs.save(update_fields=['mode', 'updated_at'])
     actions = []
     if mode == 'APPROVAL':
         actions.append({'type': 'ensure_resources', 'guild_id': gs.guild_id})
@@ -765,37 +871,80 @@ def _cmd_setmode(gs, event):
     return actions
 
 
-def _cmd_listfields(gs, event):
-    fields = FormField.objects.select_related('dropdown').filter(guild=gs).order_by('order')
-    if not fields.exists():
-        return [{'type': 'reply', 'content': get_template(gs, 'LISTFIELDS_EMPTY')}]
-    embed = {'title': '\U0001f4cb Application Form Fields', 'color': 0x3498db, 'fields': []}
+def _chunk_embed_fields(fields):
+    """Split embed fields into groups that fit Discord's per-embed limits."""
+    chunk, size = [], 0
+    for field in fields:
+        field_size = len(field['name']) + len(field['value'])
+        if chunk and (len(chunk) == _EMBED_MAX_FIELDS or size + field_size > _EMBED_MAX_CHARS):
+            yield chunk
+            chunk, size = [], 0
+        chunk.append(field)
+        size += field_size
+    if chunk:
+        yield chunk
+
+
+def _paged_embed_actions(channel_id, title, fields):
+    """One send_embed action per chunk of fields; follow-up embeds get a (cont.) title."""
+    return [
+        {'type': 'send_embed', 'channel_id': channel_id,
+         'embed': {'title': title if i == 0 else f'{title} (cont.)', 'color': 0x3498db,
+                   'fields': [dict(field) for field in chunk]}}
+        for i, chunk in enumerate(_chunk_embed_fields(fields))
+    ]
+
+
+def _listfields_embed_fields(gs):
+    """Render one embed field per FormField, cached per guild for a short TTL."""
+    now = time.monotonic()
+    cached = _listfields_cache.get(gs.guild_id)
+    if cached and now - cached[0] < _LISTFIELDS_CACHE_TTL:
+        return cached[1]
+    fields = (
+        FormField.objects.select_related('dropdown')
+        .prefetch_related('dropdown__roles', 'dropdown__channels', 'dropdown__custom_options')
+        .only('label', 'field_type', 'required', 'placeholder', 'order',
+              'dropdown__name', 'dropdown__source_type', 'dropdown__multiselect', 'dropdown__guild')
+        .filter(guild=gs).order_by('order')
+    )
+    embed_fields = []
     for f in fields:
         req = "\u2705 Required" if f.required else "\u2b55 Optional"
-        details = f"Type: `{f.get_field_type_display()}` \u2022 {req}"
+        lines = [f"Type: `{_FIELD_TYPE_DISPLAY.get(f.field_type, f.field_type)}` \u2022 {req}"]
         if f.field_type == 'dropdown' and f.dropdown:
-            src = f.dropdown.get_source_type_display()
+            src = _SOURCE_TYPE_DISPLAY.get(f.dropdown.source_type, f.dropdown.source_type)
             multi = " (multiple)" if f.dropdown.multiselect else ""
-            opts = f.dropdown.get_options()[:5]
-            preview = ', '.join(o['label'] for o in opts)
-            if len(f.dropdown.get_options()) > 5:
-                preview += f" (+{len(f.dropdown.get_options()) - 5} more)"
-            details += f"\nDropdown: **{f.dropdown.name}** [{src}]{multi}"
+            options = f.dropdown.get_options()
+            preview = ', '.join([o['label'] for o in options[:5]])
+            extra = len(options) - 5
+            if extra > 0:
+                preview += f" (+{extra} more)"
+            lines.append(f"Dropdown: **{f.dropdown.name}** [{src}]{multi}")
             if preview:
-                details += f"\nOptions: {preview}"
+                lines.append(f"Options: {preview}")
         if f.placeholder:
-            details += f"\nPlaceholder: *{f.placeholder}*"
-        embed['fields'].append({'name': f.label, 'value': details, 'inline': False})
-    return [{'type': 'send_embed', 'channel_id': event['channel_id'], 'embed': embed}]
+            lines.append(f"Placeholder: *{f.placeholder}*")
+        embed_fields.append({'name': f.label, 'value': '\n'.join(lines)[:_EMBED_MAX_VALUE], 'inline': False})
+    _listfields_cache[gs.guild_id] = (now, embed_fields)
+    return embed_fields
+
+
+def _cmd_listfields(gs, event):
+    embed_fields = _listfields_embed_fields(gs)
+    if not embed_fields:
+        return [{'type': 'reply', 'content': get_template(gs, 'LISTFIELDS_EMPTY')}]
+    return _paged_embed_actions(event['channel_id'], '\U0001f4cb Application Form Fields', embed_fields)
 
 
 def _cmd_reload(gs, event):
     _require_admin(gs, event['author']['role_ids'])
     actions = []
-    for r in event.get('guild_roles', []):
-        DiscordRole.objects.update_or_create(discord_id=r['id'], guild=gs, defaults={'name': r['name']})
-    for c in event.get('guild_channels', []):
-        DiscordChannel.objects.update_or_create(discord_id=c['id'], guild=gs, defaults={'name': c['name']})
+    # Reload is the admin's "pick up my edits now" command: skip the cache TTLs
+    clear_template_cache()
+    clear_listfields_cache()
+    _sync_cached_entities(DiscordRole, gs, event.get('guild_roles', []))
+    _sync_cached_entities(DiscordChannel, gs, event.get('guild_channels', []))
 
     missing_apps = 0
     if gs.mode == 'APPROVAL':
@@ -819,6 +968,25 @@ def _cmd_reload(gs, event):
     return actions
 
 
+def _sync_cached_entities(model, gs, items):
+    """Mirror [{'id', 'name'}] into DiscordRole/DiscordChannel, writing only new or renamed rows."""
+    incoming = {item['id']: item['name'] for item in items}
+    existing = model.objects.filter(guild=gs).values_list('discord_id', 'name')
+    for discord_id, name in existing.iterator(chunk_size=_SYNC_CHUNK_SIZE):
+        if incoming.get(discord_id) == name:
+            del incoming[discord_id]
+    if incoming:
+        # New and renamed rows go out as one INSERT ... ON CONFLICT DO UPDATE per batch
+        model.objects.bulk_create(
+            [model(discord_id=discord_id, guild=gs, name=name) for discord_id, name in incoming.items()],
+            batch_size=_SYNC_CHUNK_SIZE,
+            update_conflicts=True,
+            unique_fields=['guild', 'discord_id'],
+            update_fields=['name'],
+        )
+        clear_listfields_cache()  # bulk writes don't send post_save
+
+
 def _cmd_approve(gs, event):
     _require_admin(gs, event['author']['role_ids'])
     args = event['args']
@@ -838,32 +1006,28 @@ def _cmd_approve(gs, event):
         raise _CmdError("Please mention the user to approve: `@Bot approve @user`")
 
     target = user_mentions[0]
-
-    # get_or_create: approve works even if no Application exists
-    # (e.g. user has Pending role but wasn't tracked)
-    application, _created = Application.objects.get_or_create(
-        guild=gs, user_id=target['id'], status='PENDING',
-        defaults={
-            'user_name': target['name'],
-            'invite_code': 'manual',
-            'inviter_name': f"Approved by {event['author']['name']}",
-            'responses': {},
-        },
-    )
-
     extra_role_ids = [r['id'] for r in role_mentions if r['id'] != gs.bot_admin_role_id]
     extra_channel_ids = [c['id'] for c in channel_mentions]
 
-    result, info = _approve_user(gs, application, event['author'], event,
-                                  extra_role_ids=extra_role_ids,
-                                  extra_channel_ids=extra_channel_ids)
+    # get_or_create: approve works even if no Application exists
+    # (e.g. user has Pending role but wasn't tracked)
+    with transaction.atomic():
+        application, _created = Application.objects.select_for_update().get_or_create(
+            guild=gs, user_id=target['id'], status='PENDING',
+            defaults={
+                'user_name': target['name'],
+                'invite_code': 'manual',
+                'inviter_name': f"Approved by {event['author']['name']}",
+                'responses': {},
+            },
+        )
+        result, info = _approve_user(gs, application, event['author'], event,
+                                      extra_role_ids=extra_role_ids,
+                                      extra_channel_ids=extra_channel_ids)
     tpl = get_template(gs, 'APPROVE_CONFIRM')
-    parts = []
-    if info['roles']:
-        parts.append(', '.join(info['roles']))
-    if info['channels']:
-        parts.append(', '.join(info['channels']))
-    extras_str = '; '.join(parts) if parts else 'from rules'
+    extras_str = '; '.join(
+        ', '.join(names) for names in (info['roles'], info['channels']) if names
+    ) or 'from rules'
     result.append({'type': 'reply', 'content': tpl.format(
         user=target['name'], roles=extras_str)})
     return result
@@ -896,17 +1060,14 @@ def _cmd_bulk_approve(gs, event, target_role, skip_form_check=False):
             summary['skipped'] += 1
             skipped_names.append(m['name'])
             continue
-        user_actions, info = _approve_user(gs, app, event['author'], event)
+        user_actions, info = _approve_user(gs, app, event['author'], event, bounce_notice=False)
         actions.extend(user_actions)
         summary['approved'] += 1
 
         # Group users by their roles+channels combo
         roles_key = ', '.join(info['roles']) if info['roles'] else ''
         channels_key = ', '.join(info['channels']) if info['channels'] else ''
-        group_key = (roles_key, channels_key)
-        if group_key not in approved_groups:
-            approved_groups[group_key] = []
-        approved_groups[group_key].append(m['id'])
+        approved_groups.setdefault((roles_key, channels_key), []).append(m['id'])
 
     # Build report
     lines = [f"✅ **Bulk approve complete — {summary['approved']} approved, {summary['skipped']} skipped**"]
@@ -943,13 +1104,14 @@ def _cmd_reject(gs, event):
     target = user_mentions[0]
     reason = ' '.join(args[1:]) if len(args) > 1 else 'No reason provided'
 
-    application = Application.objects.filter(
-        guild=gs, user_id=target['id'], status='PENDING'
-    ).order_by('-created_at').first()
-    if not application:
-        raise _CmdError(get_template(gs, 'NO_PENDING_APP').format(name=target['name']))
+    with transaction.atomic():
+        application = Application.objects.select_for_update().filter(
+            guild=gs, user_id=target['id'], status='PENDING'
+        ).order_by('-created_at').first()
+        if not application:
+            raise _CmdError(get_template(gs, 'NO_PENDING_APP').format(name=target['name']))
+        result = _reject_user(gs, application, event['author'], event, reason=reason)
 
-    result = _reject_user(gs, application, event['author'], event, reason=reason)
     tpl = get_template(gs, 'REJECT_CONFIRM')
     result.append({'type': 'reply', 'content': tpl.format(user=target['name'], reason=reason)})
     return result
@@ -969,24 +1131,20 @@ def _cmd_getaccess(event):
     if not gs:
         return [{'type': 'send_dm', 'user_id': author['id'], 'content': '\u274c Server not found.'}]
 
-    app_url = os.environ.get('APP_URL', 'https://your-domain.com').rstrip('/')
-    if not app_url.startswith(('http://', 'https://')):
-        app_url = f'https://{app_url}'
-
     existing = AccessToken.objects.filter(
-        user_id=author['id'], guild=gs, expires_at__gt=timezone.now()).first()
+        user_id=author['id'], guild=gs, expires_at__gt=timezone.now()).only('token', 'expires_at').first()
     if existing:
-        url = f"{app_url}/auth/login/?token={existing.token}"
+        url = _LOGIN_URL_PREFIX + existing.token
         tpl = get_template(gs, 'GETACCESS_EXISTS')
         return [{'type': 'send_dm', 'user_id': author['id'], 'content': tpl.format(
             server=gs.guild_name, url=url, expires=existing.expires_at.strftime('%Y-%m-%d %H:%M:%S UTC'))}]
 
-    token = secrets.token_urlsafe(32)
+    token = secrets.token_urlsafe(24)  # 192 bits, 32 URL-safe chars
     expires_at = timezone.now() + timedelta(hours=24)
     AccessToken.objects.create(
         token=token, user_id=author['id'], user_name=author['name'],
         guild=gs, expires_at=expires_at)
-    url = f"{app_url}/auth/login/?token={token}"
+    url = _LOGIN_URL_PREFIX + token
     tpl = get_template(gs, 'GETACCESS_RESPONSE')
     return [{'type': 'send_dm', 'user_id': author['id'], 'content': tpl.format(
         server=gs.guild_name, url=url, expires=expires_at.strftime('%Y-%m-%d %H:%M:%S UTC'))}]
@@ -1028,7 +1186,7 @@ def _cmd_auto_translate(gs, event):
     action = args[0].lower()
     if action == 'off':
         gs.language = None
-        gs.save()
+        gs.save(update_fields=['language', 'updated_at'])
         tpl = get_template(gs, 'AUTO_TRANSLATE_OFF')
         return [{'type': 'reply', 'content': tpl}]
     elif action == 'on':
@@ -1043,7 +1201,7 @@ def _cmd_auto_translate(gs, event):
         if not code:
             raise _CmdError(f"Unsupported language: `{lang_input}`. Use a language code like `fr`, `es`, `de`, `ja`.")
         gs.language = code
-        gs.save()
+        gs.save(update_fields=['language', 'updated_at'])
         tpl = get_template(gs, 'AUTO_TRANSLATE_ON')
         return [{'type': 'reply', 'content': tpl.format(language=code)}]
     else:
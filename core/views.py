@@ -1,5 +1,6 @@
 import os
 import json
+import time
 import urllib.error
 import urllib.request
 
@@ -122,6 +123,29 @@ def _resolve_display_value(field, raw_value):
     return raw_value
 
 
+# Discord 429s on the REST post: retry a few times, honouring Retry-After,
+# but never hold a (sync) web worker longer than _MAX_RETRY_AFTER per attempt
+_RATE_LIMIT_RETRIES = 3
+_MAX_RETRY_AFTER = 5
+
+
+def _urlopen_with_retry(req):
+    """urlopen that retries rate-limited (429) responses before giving up."""
+    for attempt in range(_RATE_LIMIT_RETRIES):
+        try:
+            return urllib.request.urlopen(req)
+        except urllib.error.HTTPError as e:
+            if e.code != 429 or attempt == _RATE_LIMIT_RETRIES - 1:
+                raise
+            try:
+                retry_after = float(e.headers.get('Retry-After', 2 ** attempt))
+            except ValueError:
+                retry_after = 2 ** attempt
+            if retry_after > _MAX_RETRY_AFTER:
+                raise
+            time.sleep(retry_after)
+
+
 def _post_application_embed(guild_settings, application, fields):
     """Post the application embed to the #bounce channel via Discord REST API."""
     channel_id = guild_settings.bounce_channel_id
@@ -137,11 +161,12 @@ def _post_application_embed(guild_settings, application, fields):
     print(f'\U0001f4e4 Posting application #{application.id} to channel {channel_id}')
 
     # Build responses text with name resolution
-    responses_text = ''
+    lines = []
     for field in fields:
         raw = application.responses.get(str(field.id), 'No answer')
         display = _resolve_display_value(field, raw)
-        responses_text += f'**{field.label}:** {display}\n'
+        lines.append(f'**{field.label}:** {display}\n')
+    responses_text = ''.join(lines)
 
     embed = {
         'title': f'\U0001f4cb Application #{application.id} \u2014 {application.user_name}',
@@ -175,7 +200,7 @@ def _post_application_embed(guild_settings, application, fields):
         'User-Agent': 'DiscordBot (https://github.com/Vic-Nas/django-discord-bot, 1.0)',
     })
     try:
-        resp = urllib.request.urlopen(req)
+        resp = _urlopen_with_retry(req)
         resp_data = json.loads(resp.read().decode())
         # Save message_id for in-place editing later
         msg_id = resp_data.get('id')
@@ -314,7 +339,7 @@ def form_view(request, guild_id):
             })
 
         application.responses = responses
-        application.save()
+        application.save(update_fields=['responses'])
 
         # Post to #approvals via Discord REST API
         _post_application_embed(guild_settings, application, fields)
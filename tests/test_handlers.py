@@ -184,6 +184,75 @@ class TestHandleCommand:
         perm_action = next(a for a in actions if a['type'] == 'set_permissions')
         assert perm_action['channel_id'] == 444444444
 
+    def test_approve_extra_roles_deduped_and_named(self, test_guild, test_application):
+        """Mentioned roles already granted by the rule aren't added twice; new ones use cached names."""
+        from core.models import DiscordRole
+        DiscordRole.objects.create(discord_id=666666666, guild=test_guild, name='Verified')
+        event = {
+            'command': 'approve',
+            'args': ['<@999888777>', '<@&333333333>', '<@&666666666>'],
+            'guild_id': test_guild.guild_id,
+            'channel_id': 555555555,
+            'author': {'id': 1, 'name': 'Admin', 'role_ids': [111111111]},
+            'user_mentions': [{'id': 999888777, 'name': 'TestUser#1234'}],
+            'role_mentions': [{'id': 333333333, 'name': 'Members'}, {'id': 666666666, 'name': 'Verified'}],
+            'channel_mentions': [],
+        }
+        actions = handle_command(event)
+        added = [a['role_id'] for a in actions if a['type'] == 'add_role']
+        assert added == [333333333, 666666666]
+        dm = next(a for a in actions if a['type'] == 'send_dm')
+        assert 'Members, Verified' in dm['content']
+
+    def test_approve_without_dm(self, test_guild, test_application):
+        """Guilds with dm_on_approval off still get roles but no DM."""
+        test_guild.dm_on_approval = False
+        test_guild.save()
+        event = {
+            'command': 'approve',
+            'args': ['<@999888777>'],
+            'guild_id': test_guild.guild_id,
+            'channel_id': 555555555,
+            'author': {'id': 1, 'name': 'Admin', 'role_ids': [111111111]},
+            'user_mentions': [{'id': 999888777, 'name': 'TestUser#1234'}],
+            'role_mentions': [],
+            'channel_mentions': [],
+        }
+        actions = handle_command(event)
+        types = [a['type'] for a in actions]
+        assert 'add_role' in types
+        assert 'send_dm' not in types
+        notice_at = next(i for i, a in enumerate(actions) if a['type'] == 'send_message')
+        notice = actions[notice_at]
+        assert notice['channel_id'] == test_guild.bounce_channel_id
+        assert notice['content'] == '✅ <@999888777> approved by Admin → Members'
+        # The #bounce cleanup runs in the same channel lane; it must not delete the notice
+        assert all(i < notice_at for i, a in enumerate(actions)
+                   if a['type'] == 'cleanup_channel' and a['channel_id'] == notice['channel_id'])
+
+    def test_bulk_approve_without_dm_posts_no_notices(self, test_guild):
+        """Bulk approve with DMs off relies on its reply, not one #bounce post per member."""
+        test_guild.dm_on_approval = False
+        test_guild.save()
+        event = {
+            'command': 'approve',
+            'args': ['noform', '<@&222222222>'],
+            'guild_id': test_guild.guild_id,
+            'channel_id': 555555555,
+            'author': {'id': 1, 'name': 'Admin', 'role_ids': [111111111]},
+            'user_mentions': [],
+            'role_mentions': [{'id': 222222222, 'name': 'Pending'}],
+            'channel_mentions': [],
+            'members_with_role': [{'id': 701, 'name': 'A'}, {'id': 702, 'name': 'B'}],
+        }
+        actions = handle_command(event)
+        types = [a['type'] for a in actions]
+        assert 'send_dm' not in types
+        assert 'send_message' not in types
+        reply = actions[-1]
+        assert reply['type'] == 'reply'
+        assert '<@701>, <@702>' in reply['content']
+
 
 class TestHandleReaction:
     def test_approve_via_reaction(self, test_guild, test_application):
@@ -398,6 +467,39 @@ class TestListfieldsCommand:
         assert 'Name' in field_names
         assert 'Pick Role' in field_names
 
+    def test_listfields_splits_over_25_fields(self, test_guild):
+        from core.models import FormField
+        FormField.objects.bulk_create([
+            FormField(guild=test_guild, label=f'Q{i}', field_type='text', order=i)
+            for i in range(30)
+        ])
+        event = {
+            'command': 'listfields',
+            'args': [],
+            'guild_id': test_guild.guild_id,
+            'channel_id': 555555555,
+            'author': {'id': 1, 'name': 'Admin', 'role_ids': [111111111]},
+        }
+        actions = handle_command(event)
+        embeds = [a['embed'] for a in actions if a['type'] == 'send_embed']
+        assert [len(e['fields']) for e in embeds] == [25, 5]
+        assert embeds[1]['fields'][0]['name'] == 'Q25'
+
+    def test_listfields_cache_invalidated_on_field_change(self, test_guild, test_form_fields):
+        from core.models import FormField
+        event = {
+            'command': 'listfields',
+            'args': [],
+            'guild_id': test_guild.guild_id,
+            'channel_id': 555555555,
+            'author': {'id': 1, 'name': 'Admin', 'role_ids': [111111111]},
+        }
+        handle_command(event)
+        FormField.objects.create(guild=test_guild, label='Age', field_type='text', order=9)
+        actions = handle_command(event)
+        embed_action = next(a for a in actions if a['type'] == 'send_embed')
+        assert 'Age' in [f['name'] for f in embed_action['embed']['fields']]
+
 
 class TestReloadCommand:
     def test_reload_syncs_roles_and_channels(self, test_guild):
@@ -424,6 +526,23 @@ class TestReloadCommand:
         assert DiscordRole.objects.filter(guild=test_guild, discord_id=444444444).exists()
         assert DiscordChannel.objects.filter(guild=test_guild, discord_id=555555555).exists()
 
+    def test_reload_updates_renamed_roles(self, test_guild):
+        from core.models import DiscordRole
+        event = {
+            'command': 'reload',
+            'args': [],
+            'guild_id': test_guild.guild_id,
+            'channel_id': 555555555,
+            'author': {'id': 1, 'name': 'Admin', 'role_ids': [111111111]},
+            'guild_roles': [{'id': 333333333, 'name': 'Regulars'}],
+            'guild_channels': [],
+            'guild_members': [],
+        }
+        handle_command(event)
+        role = DiscordRole.objects.get(guild=test_guild, discord_id=333333333)
+        assert role.name == 'Regulars'
+        assert DiscordRole.objects.filter(guild=test_guild, discord_id=333333333).count() == 1
+
 
 class TestProcessAction:
     """Test individual action types via the automation engine."""
@@ -660,4 +779,46 @@ class TestAutoTranslateCommand:
             'author': {'id': 1, 'name': 'Admin', 'role_ids': [111111111]},
         }
         actions = handle_command(event)
-        assert any('Usage' in a.get('content', '') for a in actions)
\ No newline at end of file
+        assert any('Usage' in a.get('content', '') for a in actions)
+
+
+class TestTemplateCache:
+    """Template lookups are cached but follow template edits."""
+
+    def test_custom_template_invalidates_cache(self, test_guild):
+        from bot.handlers.templates import get_template
+        from core.models import GuildMessageTemplate, MessageTemplate
+
+        default = get_template(test_guild, 'APPROVE_DM')
+        assert 'approved' in default
+
+        GuildMessageTemplate.objects.create(
+            guild=test_guild,
+            template=MessageTemplate.objects.get(template_type='APPROVE_DM'),
+            custom_content='Welcome aboard, {roles}!',
+        )
+        assert get_template(test_guild, 'APPROVE_DM') == 'Welcome aboard, {roles}!'
+
+    def test_async_lookup_served_from_cache(self, test_guild, django_assert_num_queries):
+        import asyncio
+        from bot.handlers.templates import get_template, get_template_async
+
+        expected = get_template(test_guild, 'APPROVE_DM')
+        with django_assert_num_queries(0):
+            assert asyncio.run(get_template_async(test_guild, 'APPROVE_DM')) == expected
+
+    def test_reload_drops_cached_templates(self, test_guild):
+        from bot.handlers.templates import get_template
+        from core.models import MessageTemplate
+
+        get_template(test_guild, 'APPROVE_DM')
+        # queryset.update() bypasses post_save, so only reload can pick it up early
+        MessageTemplate.objects.filter(template_type='APPROVE_DM').update(default_content='Edited {roles}')
+        handle_command({
+            'command': 'reload',
+            'args': [],
+            'guild_id': test_guild.guild_id,
+            'channel_id': 555555555,
+            'author': {'id': 1, 'name': 'Admin', 'role_ids': [111111111]},
+        })
+        assert get_template(test_guild, 'APPROVE_DM') == 'Edited {roles}'
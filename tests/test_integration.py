@@ -8,7 +8,7 @@ Uses fixtures from conftest.py.
 import pytest
 from core.models import (
     GuildSettings, Application, Automation, Action,
-    InviteRule, DiscordRole, FormField,
+    InviteRule, DiscordRole, DiscordChannel, FormField,
 )
 from core.services import (
     handle_member_join, handle_command, handle_reaction,
@@ -213,6 +213,160 @@ class TestAutomationEngine:
         actions = process_event('MEMBER_JOIN', event)
         assert actions == []
 
+    def test_disabled_action_skipped_and_order_kept(self, test_guild):
+        """Only enabled actions run, in ascending order."""
+        auto = Automation.objects.create(
+            guild=test_guild, name='ordered', trigger='MEMBER_JOIN',
+            trigger_config={}, enabled=True,
+        )
+        Action.objects.create(
+            automation=auto, order=2, action_type='SEND_MESSAGE',
+            config={'channel': 'bounce', 'content': 'second'},
+        )
+        Action.objects.create(
+            automation=auto, order=1, action_type='SEND_MESSAGE',
+            config={'channel': 'bounce', 'content': 'first'},
+        )
+        Action.objects.create(
+            automation=auto, order=3, action_type='SEND_MESSAGE',
+            config={'channel': 'bounce', 'content': 'disabled'}, enabled=False,
+        )
+
+        event = {
+            'guild_id': test_guild.guild_id,
+            'member': {'id': 42, 'name': 'User'},
+            'invite': {'code': 'default'},
+        }
+        actions = process_event('MEMBER_JOIN', event)
+        assert [a['content'] for a in actions] == ['first', 'second']
+
+    def test_string_ids_in_config_normalized_on_save(self, test_guild):
+        """Snowflakes typed as JSON strings resolve like ints."""
+        auto = Automation.objects.create(
+            guild=test_guild, name='string ids', trigger='MEMBER_JOIN',
+            trigger_config={}, enabled=True,
+        )
+        action = Action.objects.create(
+            automation=auto, order=1, action_type='SEND_MESSAGE',
+            config={'channel': '123456789012345678', 'content': 'hi'},
+        )
+        action.refresh_from_db()
+        assert action.config['channel'] == 123456789012345678
+
+        event = {
+            'guild_id': test_guild.guild_id,
+            'member': {'id': 42, 'name': 'User'},
+            'invite': {'code': 'default'},
+        }
+        actions = process_event('MEMBER_JOIN', event)
+        assert actions[0]['channel_id'] == 123456789012345678
+
+    def test_numeric_role_name_not_taken_for_id(self, test_guild):
+        """Short all-digit strings are names (a role called "2024"), not snowflakes."""
+        DiscordRole.objects.create(discord_id=987654321012345678, guild=test_guild, name='2024')
+        auto = Automation.objects.create(
+            guild=test_guild, name='numeric name', trigger='MEMBER_JOIN',
+            trigger_config={}, enabled=True,
+        )
+        action = Action.objects.create(
+            automation=auto, order=1, action_type='ADD_ROLE', config={'role': '2024'},
+        )
+        action.refresh_from_db()
+        assert action.config['role'] == '2024'
+
+        event = {
+            'guild_id': test_guild.guild_id,
+            'member': {'id': 42, 'name': 'User'},
+            'invite': {'code': 'default'},
+        }
+        actions = process_event('MEMBER_JOIN', event)
+        assert actions[0]['role_id'] == 987654321012345678
+
+
+class TestGuildSetup:
+    """Guild setup's DB writes: default automations and the role/channel cache."""
+
+    def test_default_automations_created_once(self, test_guild, monkeypatch):
+        """Guild setup seeds the default automations in bulk and is idempotent."""
+        from bot.handlers import guild_setup
+        defaults = [
+            {'name': 'Greet', 'trigger': 'MEMBER_JOIN', 'actions': [
+                {'order': 1, 'action_type': 'SEND_MESSAGE',
+                 'config': {'channel': '123456789012345678', 'content': 'hi'}},
+                {'order': 2, 'action_type': 'ADD_ROLE', 'config': {'from_rule': True}},
+            ]},
+            {'name': 'Bye', 'trigger': 'MEMBER_LEAVE', 'actions': []},
+        ]
+        monkeypatch.setattr(guild_setup, '_load_automation_fixture', lambda: defaults)
+
+        assert guild_setup._create_default_automations_db(test_guild) == 2
+        greet = Automation.objects.get(guild=test_guild, name='Greet')
+        assert [a.config for a in greet.actions.all()] == [
+            {'channel': 123456789012345678, 'content': 'hi'}, {'from_rule': True}]
+        assert defaults[0]['actions'][0]['config']['channel'] == '123456789012345678'  # fixture untouched
+
+        assert guild_setup._create_default_automations_db(test_guild) == 2
+        assert Automation.objects.filter(guild=test_guild).count() == 2
+
+    def test_persist_resources_writes_only_new_or_renamed(self, test_guild, django_assert_num_queries):
+        """Setup's cache upsert leaves unchanged rows alone and fixes renamed ones."""
+        from types import SimpleNamespace
+        from bot.handlers.guild_setup import _persist_resources
+
+        DiscordRole.objects.create(discord_id=777, guild=test_guild, name='Old')
+        before = dict(DiscordRole.objects.filter(guild=test_guild).values_list('discord_id', 'name'))
+        roles = [
+            SimpleNamespace(id=333333333, name='Members'),  # cached, unchanged
+            SimpleNamespace(id=777, name='Renamed'),
+            SimpleNamespace(id=888, name='Brand New'),
+        ]
+        # Savepoint, cache lookup, one upsert, settings save, release
+        with django_assert_num_queries(5):
+            _persist_resources(test_guild, roles, [])
+
+        names = dict(DiscordRole.objects.filter(guild=test_guild).values_list('discord_id', 'name'))
+        assert names == {**before, 777: 'Renamed', 888: 'Brand New'}
+
+    def test_persist_resources_skips_write_when_unchanged(self, test_guild, django_assert_num_queries):
+        """Re-running setup on an unchanged guild issues no cache upsert at all."""
+        from types import SimpleNamespace
+        from bot.handlers.guild_setup import _persist_resources
+
+        before = list(DiscordRole.objects.filter(guild=test_guild).values_list('discord_id', 'name'))
+        # Savepoint, cache lookup, settings save, release
+        with django_assert_num_queries(4):
+            _persist_resources(test_guild, [SimpleNamespace(id=333333333, name='Members')], [])
+
+        assert list(DiscordRole.objects.filter(guild=test_guild).values_list('discord_id', 'name')) == before
+
+    def test_ensure_resources_saves_only_repaired_ids(self, test_guild):
+        """A stale cached instance repairs #bounce without undoing a panel edit."""
+        import copy
+        from types import SimpleNamespace
+        from unittest import mock
+        from asgiref.sync import async_to_sync
+        from bot.handlers.guild_setup import ensure_required_resources
+
+        stale = copy.copy(test_guild)  # as held in the bot's settings cache
+        GuildSettings.objects.filter(pk=test_guild.pk).update(pending_channel_id=888888888)
+
+        # #bounce (555555555) was deleted; everything else still resolves
+        new_bounce = SimpleNamespace(id=666666666, name='bounce')
+        guild = SimpleNamespace(
+            get_role=lambda rid: mock.Mock(id=rid),
+            get_channel=lambda cid: None if cid == 555555555 else SimpleNamespace(id=cid),
+            channels=[], default_role=mock.Mock(), me=mock.Mock(),
+            create_text_channel=mock.AsyncMock(return_value=new_bounce),
+        )
+        bot = SimpleNamespace(get_guild=lambda gid: guild)
+
+        async_to_sync(ensure_required_resources)(bot, stale)
+
+        test_guild.refresh_from_db()
+        assert test_guild.bounce_channel_id == 666666666
+        assert test_guild.pending_channel_id == 888888888  # panel edit kept
+        assert DiscordChannel.objects.filter(guild=test_guild, discord_id=666666666, name='bounce').exists()
+
 
 class TestFormBasedApproval:
     """Integration: APPROVAL with form fields → approve assigns roles + channels."""